@@ -1,11 +1,26 @@
+import copy
+import io
 import json
+import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from fractions import Fraction
 
 from tivars.models import *
 from tivars.types import *
-from tivars import TIHeader, TIVar, TIFlashHeader
+from tivars import TIHeader, TIVar, TIFlashHeader, CacheInfo, Diagnostics, ParseCache, load_many, scan
+from tivars.diagnostics import warn
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
 
 
 class ModelTests(unittest.TestCase):
@@ -15,6 +30,31 @@ class ModelTests(unittest.TestCase):
 
         self.assertEqual(TIModel.MODELS, sorted(TIModel.MODELS))
 
+    def test_features(self):
+        self.assertTrue(TI_84PCE.has(TIFeature.Color))
+        self.assertFalse(TI_84PCE.has(TIFeature.Python))
+        self.assertFalse(TI_82AEP.has(TIFeature.Apps))
+
+        flags = EquationFlags({0: 1})
+        flags |= {3: 1}
+
+        self.assertEqual(int(flags), 0b1001)
+        self.assertEqual(dict(flags), {bit: int(bit in (0, 3)) for bit in range(8)})
+        self.assertEqual(EquationFlags.get(EquationFlags.set(flags)), flags)
+
+        self.assertEqual(GraphColor.get_name(GraphColor.Black), "Black")
+        self.assertIsNone(GraphColor.get_name(0x99))
+
+    def test_os_rank(self):
+        self.assertLess(TI_84P.rank("2.30"), TI_84P.rank("2.55"))
+        self.assertLess(TI_84P.rank("2.9"), TI_84P.rank("2.10"))
+        self.assertLess(TI_84P.rank("latest"), TI_84PCE.rank())
+        self.assertLess(TI_84PCE.rank("5.3"), TI_84PCE.rank("5.3.1"))
+        self.assertEqual(os_rank(TI_83P.OS("1.16")), TI_83P.rank("1.16"))
+
+        self.assertEqual(TIProgram("Disp 1").get_version(), 0x00)
+        self.assertEqual(TIProgram("getTime").get_version(), 0x23)
+
 
 class VarTests(unittest.TestCase):
     def test_all_attributes(self):
@@ -80,6 +120,263 @@ class VarTests(unittest.TestCase):
 
         self.assertEqual(second, clibs.entries[1])
 
+    def test_write(self):
+        clibs = TIVar.open("tests/data/var/clibs.8xg")
+        clibs.write(buffer := io.BytesIO())
+
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            self.assertEqual(buffer.getvalue(), file.read())
+
+        class Stream(io.BytesIO):
+            def seekable(self) -> bool:
+                return False
+
+        with Diagnostics("ignore"):
+            malformed = TIVar.open("tests/data/var/LICENSE")
+
+        for var in clibs, malformed:
+            var.write(buffer := io.BytesIO())
+            var.write(stream := Stream())
+
+            self.assertEqual(stream.getvalue(), buffer.getvalue())
+            self.assertEqual(var.bytes(), buffer.getvalue())
+            self.assertEqual(buffer.getvalue()[53:55], int.to_bytes(var.entry_length, 2, 'little'))
+
+    def test_lazy_open(self):
+        clibs = TIVar.open("tests/data/var/clibs.8xg")
+
+        with TIVar.open("tests/data/var/clibs.8xg", lazy=True) as lazy_clibs:
+            self.assertEqual(len(lazy_clibs.entries), 9)
+            self.assertFalse(lazy_clibs.entries.is_parsed(1))
+
+            self.assertEqual(lazy_clibs.entries[1], clibs.entries[1])
+            self.assertTrue(lazy_clibs.entries.is_parsed(1))
+            self.assertFalse(lazy_clibs.entries.is_parsed(2))
+
+            self.assertEqual(lazy_clibs.bytes(), clibs.bytes())
+
+        corrupted = clibs.bytes()[:-1] + b'\x00'
+        with Diagnostics() as diagnostics:
+            lazy_corrupted = TIVar()
+            lazy_corrupted.load_buffer(corrupted)
+
+            self.assertFalse(any(lazy_corrupted.entries.is_parsed(index) for index in range(9)))
+            self.assertFalse(diagnostics)
+
+            lazy_corrupted.validate()
+
+        self.assertEqual([record.code for record in diagnostics], ["checksum"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            open(empty := os.path.join(directory, "EMPTY.8xp"), 'wb').close()
+
+            with Diagnostics() as diagnostics:
+                TIVar.open(empty)
+
+            with Diagnostics() as lazy_diagnostics, TIVar.open(empty, lazy=True) as lazy_empty:
+                self.assertEqual(len(lazy_empty.entries), 0)
+
+            self.assertEqual(lazy_diagnostics.records, diagnostics.records)
+
+    def test_trusted_open(self):
+        clibs = TIVar.open("tests/data/var/clibs.8xg")
+        trusted_clibs = TIVar.open("tests/data/var/clibs.8xg", trusted=True)
+
+        self.assertEqual(trusted_clibs.bytes(), clibs.bytes())
+        self.assertEqual([type(entry) for entry in trusted_clibs.entries], [type(entry) for entry in clibs.entries])
+
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            data = bytearray(file.read())
+            data[-1] ^= 0xFF
+
+        corrupt = TIVar()
+        corrupt.load_bytes(data, trusted=True)
+
+        with self.assertWarns(BytesWarning):
+            corrupt.validate()
+
+    def test_diagnostics(self):
+        with open("tests/data/var/clibs.8xg", 'rb') as file:
+            data = bytearray(file.read())
+            data[-1] ^= 0xFF
+
+        with Diagnostics() as diagnostics:
+            TIVar(data=data)
+
+        self.assertEqual([diagnostic.code for diagnostic in diagnostics], ["checksum"])
+        self.assertIs(diagnostics.records[0].category, BytesWarning)
+
+        with self.assertWarns(BytesWarning):
+            diagnostics.emit()
+
+        with self.assertRaises(BytesWarning), Diagnostics("error"):
+            TIVar(data=data)
+
+        with Diagnostics("ignore") as diagnostics:
+            TIVar(data=data)
+
+        self.assertFalse(diagnostics)
+
+    def test_scan(self):
+        infos = list(scan("tests/data/var"))
+        self.assertEqual(len(infos), 28)
+        self.assertEqual(infos, list(scan("tests/data/var", threads=2)))
+
+        # Walks more directories than there are threads, so that results are consumed while others are scanned
+        with Diagnostics("ignore"):
+            self.assertEqual(list(scan("tests", threads=1))[-len(infos):], infos)
+
+        clibs = TIVar.open("tests/data/var/clibs.8xg")
+        info = next(info for info in infos if info.filename.endswith("clibs.8xg"))
+
+        self.assertEqual(info.magic, clibs.header.magic)
+        self.assertEqual(info.entries[1], (0x15, "GRAPHX", clibs.entries[1].calc_data_length, True))
+        self.assertEqual(len(info.entries), 9)
+
+    def test_scan_unreadable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            shutil.copy("tests/data/var/clibs.8xg", directory)
+            os.symlink(os.path.join(directory, "missing.8xp"), os.path.join(directory, "broken.8xp"))
+
+            with open(os.path.join(directory, "notes.txt"), 'w') as file:
+                file.write("not a var")
+
+            codes = []
+            for threads in None, 2:
+                with Diagnostics() as diagnostics:
+                    infos = list(scan(directory, threads=threads))
+
+                self.assertEqual([os.path.basename(info.filename) for info in infos], ["clibs.8xg"])
+                codes.append([record.code for record in diagnostics])
+
+            self.assertEqual(codes[0].count("unreadable"), 1)
+            self.assertEqual(codes[0].count("not-a-var"), 1)
+            self.assertEqual(codes[0], codes[1])
+
+    def test_threaded_open(self):
+        def load(filename: str):
+            with Diagnostics() as diagnostics:
+                var = TIVar.open(filename)
+                strings = [str(entry) for entry in var.entries if type(entry).string is not TIEntry.string]
+
+            return var.bytes(), [type(entry) for entry in var.entries], strings, [*diagnostics]
+
+        filenames = [info.filename for info in scan("tests/data/var")]
+        expected = [load(filename) for filename in filenames]
+
+        with ThreadPoolExecutor(16) as executor:
+            self.assertEqual(list(executor.map(load, filenames * 10)), expected * 10)
+
+    def test_load_many(self):
+        filenames = ["tests/data/var/Program.8xp", "tests/data/var/clibs.8xg", "tests/data/var/Real.8xn"]
+
+        results = list(load_many(filenames, workers=2))
+        self.assertEqual([filename for filename, _ in results], filenames)
+        self.assertEqual([var.bytes() for _, var in results], [TIVar.open(filename).bytes() for filename in filenames])
+
+        missing = [filenames[0], "tests/data/var/missing.8xp", *filenames[1:]]
+
+        with self.assertRaises(FileNotFoundError):
+            list(load_many(missing, workers=2))
+
+        results = dict(load_many(missing, workers=2, ordered=False, errors="return"))
+        self.assertIsInstance(results.pop("tests/data/var/missing.8xp"), FileNotFoundError)
+        self.assertEqual([type(var) for var in results.values()], [TIVar] * 3)
+
+        self.assertEqual(sorted(filename for filename, _ in load_many(filenames, workers=2, ordered=False)),
+                         sorted(filenames))
+
+        (_, header), = load_many(["tests/data/var/smartpad.8xk"], workers=1, kind="flash")
+        self.assertEqual(header.bytes(), TIFlashHeader.open("tests/data/var/smartpad.8xk").bytes())
+
+    def test_pickle(self):
+        clibs = TIVar.open("tests/data/var/clibs.8xg")
+        self.assertEqual(pickle.loads(pickle.dumps(clibs)), clibs)
+
+        colorz = TIEntry.open("tests/data/var/COLORZ.8xp")
+        self.assertEqual(type(pickle.loads(pickle.dumps(colorz))), TIProtectedAsmProgram)
+
+        equation = TIGraphedEquation("sin(X", name="Y1")
+        equation.style, equation.color = GraphStyle.DottedLine, GraphColor.Red
+
+        unpickled = pickle.loads(pickle.dumps(equation))
+        self.assertEqual((unpickled, unpickled.style, unpickled.color), (equation, GraphStyle.DottedLine, GraphColor.Red))
+
+        header = TIFlashHeader.open("tests/data/var/smartpad.8xk")
+        self.assertEqual(pickle.loads(pickle.dumps(header)).bytes(), header.bytes())
+
+    def test_parse_cache(self):
+        TIVar.parse_cache = TIFlashHeader.parse_cache = cache = ParseCache(maxsize=2)
+
+        try:
+            first, second = TIVar.open("tests/data/var/clibs.8xg"), TIVar.open("tests/data/var/clibs.8xg")
+            self.assertEqual(first, second)
+            self.assertIsNot(first.entries[0], second.entries[0])
+
+            second.entries[0].length = 0
+            self.assertEqual(TIVar.open("tests/data/var/clibs.8xg"), first)
+            self.assertEqual(TIVar(data=first.bytes()), first)
+
+            with Diagnostics() as diagnostics:
+                TIVar(data=first.bytes()[:-1] + b'\x00')
+                TIVar(data=first.bytes()[:-1] + b'\x00')
+
+            self.assertEqual([record.code for record in diagnostics], ["checksum"] * 2)
+
+            header = TIFlashHeader.open("tests/data/var/smartpad.8xk")
+            self.assertEqual(type(TIFlashHeader.open("tests/data/var/smartpad.8xk")), TIApp)
+            self.assertEqual(TIFlashHeader.open("tests/data/var/smartpad.8xk").bytes(), header.bytes())
+
+            self.assertEqual(cache.info(), CacheInfo(6, 3, 2, 2, len(first.bytes()) + len(header.bytes())))
+
+            def codes(model: TIModel) -> list[str]:
+                with Diagnostics() as model_diagnostics:
+                    TIVar(model=model, data=program)
+
+                return [record.code for record in model_diagnostics]
+
+            with open("tests/data/var/Program.8xp", 'rb') as file:
+                program = file.read()
+
+            TIVar.parse_cache = None
+            expected = codes(TI_84PCE), codes(TI_83P)
+
+            TIVar.parse_cache = cache
+            self.assertEqual((codes(TI_84PCE), codes(TI_83P)), expected)
+            self.assertEqual((codes(TI_84PCE), codes(TI_83P)), expected)
+            self.assertEqual(expected[0], ["model"])
+
+            def error(data: bytes) -> tuple[type, str]:
+                with self.assertRaises(Warning) as context, Diagnostics("error"):
+                    TIVar(data=data)
+
+                return type(context.exception), str(context.exception)
+
+            truncated = first.bytes()[:200]
+
+            TIVar.parse_cache = None
+            expected = error(truncated)
+
+            TIVar.parse_cache = cache
+            self.assertEqual(error(truncated), expected)
+            self.assertEqual(error(truncated), expected)
+            self.assertIn("data section length", expected[1])
+
+            def failing():
+                warn("Something looks off.", BytesWarning, code="checksum")
+                raise ValueError("Something is wrong.")
+
+            with Diagnostics() as diagnostics, self.assertRaises(ValueError):
+                cache.fetch(b'\x00', failing)
+
+            self.assertEqual([record.code for record in diagnostics], ["checksum"])
+
+            with Diagnostics("error"), self.assertRaises(BytesWarning):
+                cache.fetch(b'\x00', failing)
+
+        finally:
+            TIVar.parse_cache = TIFlashHeader.parse_cache = None
+
     def test_save_to_file(self):
         test_var = TIVar.open("tests/data/var/Program.8xp")
 
@@ -116,6 +413,102 @@ class EntryTests(unittest.TestCase):
             with open("tests/data/var/Program_new.8xp", 'rb') as new:
                 self.assertEqual(new.read(), orig.read())
 
+    def test_extensions(self):
+        test_program = TIProgram.open("tests/data/var/Program.8xp")
+
+        self.assertEqual(test_program.export(model=TI_82ST).extension, "83p")
+        self.assertEqual(test_program.export(model=TI_84PCE).extension, "8xp")
+        self.assertEqual(TIOperatingSystem().extension(TI_84PCET), "8eu")
+        self.assertEqual(TIOperatingSystem().extension(TI_83PCEEP), "8pu")
+
+        self.assertEqual(TIHeader(TI_84PT).targets(), {TI_84PT})
+        self.assertEqual((TIHeader(TI_84PT) | [test_program]).extension, "8xp")
+
+    def test_cached_bytes(self):
+        test_program = TIProgram.open("tests/data/var/Program.8xp")
+        test_bytes = test_program.bytes()
+
+        test_program.name = "GETDATE"
+        self.assertEqual(test_program.bytes(), test_bytes.replace(b"SETDATE", b"GETDATE"))
+        self.assertEqual(test_program.byte_sum(), sum(test_program.bytes()))
+
+        test_program.archived = True
+        self.assertNotEqual(test_program.bytes(), test_bytes.replace(b"SETDATE", b"GETDATE"))
+
+        test_program.load_bytes(test_bytes)
+        self.assertEqual(test_program.bytes(), test_bytes)
+
+    def test_meta_layout(self):
+        test_program = TIProgram.open("tests/data/var/Program.8xp")
+        test_program.meta_length = TIEntry.base_meta_length
+        test_bytes = test_program.bytes()
+
+        test_trusted = TIProgram()
+        test_trusted.load_bytes(test_bytes, trusted=True)
+        self.assertEqual(test_trusted, test_program)
+
+        with Diagnostics() as diagnostics:
+            test_flashless = TIProgram(b'\x0d' + test_bytes[1:])
+
+        self.assertEqual(diagnostics.records[0].code, "meta-length")
+        self.assertEqual(test_flashless.bytes(), test_bytes)
+
+    def test_copy(self):
+        test_program = TIProgram.open("tests/data/var/Program.8xp")
+        test_copy = copy.copy(test_program)
+
+        self.assertEqual(test_copy, test_program)
+        self.assertIs(test_copy.raw.calc_data, test_program.raw.calc_data)
+
+        test_copy.load_string("Disp 1")
+        self.assertEqual(test_program.string(), "setDate(1")
+        self.assertEqual(test_copy.string(), "Disp 1")
+
+        test_var = TIVar.open("tests/data/var/clibs.8xg")
+        test_var_copy = copy.copy(test_var)
+        test_var_copy.entries[0].length = 0
+
+        self.assertEqual(test_var.bytes(), TIVar.open("tests/data/var/clibs.8xg").bytes())
+        self.assertNotEqual(test_var_copy.bytes(), test_var.bytes())
+
+        test_matrix = TIMatrix()
+        test_matrix.load_rows([[1, 2], [3, 4]])
+
+        test_matrix.width = 2
+        buffer = test_matrix.raw.calc_data
+        test_matrix.height = 2
+        self.assertIs(test_matrix.raw.calc_data, buffer)
+
+        test_matrix_copy = copy.copy(test_matrix)
+        test_matrix.height = 1
+        self.assertIsNot(test_matrix.raw.calc_data, buffer)
+        self.assertEqual(test_matrix_copy.height, 2)
+
+        view = test_matrix.calc_data_view()
+        test_matrix.width = 1
+        self.assertEqual((view[0], test_matrix.width), (2, 1))
+
+    def test_content_hash(self):
+        test_program = TIProgram.open("tests/data/var/Program.8xp")
+        test_copy = copy.copy(test_program)
+
+        self.assertEqual(test_copy.content_hash(), test_program.content_hash())
+        self.assertEqual(len({test_program, test_copy, TIProgram.open("tests/data/var/Program.8xp")}), 1)
+
+        test_copy.load_string("Disp 1")
+        self.assertNotEqual(test_copy.content_hash(), test_program.content_hash())
+        self.assertNotEqual(test_copy, test_program)
+
+        test_var = TIVar.open("tests/data/var/clibs.8xg")
+        self.assertEqual({test_var: 1}[copy.copy(test_var)], 1)
+
+        test_var.entries[0].name = "CLIBS2"
+        self.assertNotEqual(test_var.content_hash(), TIVar.open("tests/data/var/clibs.8xg").content_hash())
+
+        test_app = TIFlashHeader.open("tests/data/var/smartpad.8xk")
+        self.assertEqual(TIFlashHeader.open("tests/data/var/smartpad.8xk"), test_app)
+        self.assertEqual(hash(copy.copy(test_app)), hash(test_app))
+
     def test_form_vars(self):
         test_program = TIProgram()
         test_header = TIHeader()
@@ -145,6 +538,15 @@ class EntryTests(unittest.TestCase):
 
 
 class TokenizationTests(unittest.TestCase):
+    def test_load_dispatch(self):
+        test_program = TIProgram("Disp 1")
+
+        self.assertEqual(TIProgram(test_program.tokens()), test_program)
+        self.assertEqual(TIProgram(test_program.bytes()), test_program)
+
+        with self.assertRaises(TypeError):
+            TIProgram(1)
+
     def test_load_from_file(self):
         test_var = TIVar.open("tests/data/var/Program.8xp")
 
@@ -263,6 +665,18 @@ class NumericTests(unittest.TestCase):
             file.seek(55)
             self.assertEqual(test_num.bytes(), file.read()[:-2])
 
+    def test_subtype_bits(self):
+        test_real = TIReal("-42.1337")
+        self.assertEqual((test_real.subtype_id, test_real.graph_bit, test_real.sign_bit), (0x00, 0, 1))
+
+        test_real.subtype_id = 0x1C
+        self.assertEqual(test_real.raw.calc_data[0], 0x9C)
+
+        with self.assertWarns(BytesWarning):
+            test_real.graph_bit = 2
+
+        self.assertEqual((test_real.subtype_id, test_real.graph_bit, test_real.sign_bit), (0x1C, 0, 1))
+
     def test_real_number(self):
         self.real_float_test(TIReal, "Real", "A", -1, 129, 42133700000000, "-42.1337",
                              Decimal("-42.1337"))
@@ -275,6 +689,19 @@ class NumericTests(unittest.TestCase):
         self.real_float_test(TIRealPiFraction, "Exact_RealPiFrac", "D", 1, 127, 28571428571429, "2π/7",
                              Decimal("0.89759790102567"))
 
+    def test_cached_decimal(self):
+        test_num = TIReal("1.5")
+        self.assertEqual(test_num.decimal(), Decimal("1.5"))
+
+        test_num.sign_bit = 1
+        self.assertEqual(test_num.decimal(), Decimal("-1.5"))
+
+        test_num.exponent += 1
+        self.assertEqual(test_num.decimal(), Decimal("-15"))
+
+        test_num.load_string("2.25")
+        self.assertEqual(f"{test_num}", "2.25")
+
     def test_real_radical(self):
         test_radical = TIRealRadical.open("tests/data/var/Exact_RealRadical.8xn")
 
@@ -350,6 +777,19 @@ class NumericTests(unittest.TestCase):
         self.assertEqual(str(test_num), "1 + 0.6i")
         self.assertEqual(type(test_num), TIComplex)
 
+    def test_string_dispatch(self):
+        self.assertEqual(type(TIEntry("-1.5")), TIReal)
+        self.assertEqual(type(TIEntry("3 / 4")), TIRealFraction)
+        self.assertEqual(type(TIEntry("(4√5+2√3)/7")), TIRealRadical)
+        self.assertEqual(type(TIEntry("2π")), TIRealPi)
+        self.assertEqual(type(TIEntry("2π/3")), TIRealPiFraction)
+        self.assertEqual(type(TIEntry("1+2i")), TIComplex)
+        self.assertEqual(type(TIEntry("3/4+1/2i")), TIComplexFraction)
+        self.assertEqual(type(TIEntry("Disp 1")), TIEquation)
+
+        with self.assertRaises(ValueError):
+            TIAppVar("1.5")
+
 
 class ArrayTests(unittest.TestCase):
     def test_real_list(self):
@@ -442,6 +882,104 @@ class ArrayTests(unittest.TestCase):
         test_matrix.load_string(string)
         self.assertEqual(test_matrix.matrix(), test_array)
 
+    def test_real_array(self):
+        test_matrix = TIMatrix.open("tests/data/var/Matrix_3x3_standard.8xm")
+        test_array = RealArray(test_matrix.data)
+
+        self.assertEqual(len(test_array), 9)
+        self.assertEqual(list(test_array), list(test_matrix))
+        self.assertEqual(test_array.float(), [entry.float() for entry in test_matrix])
+        self.assertEqual(test_array.decimal(), [entry.decimal() for entry in test_matrix])
+        self.assertEqual(test_array.sign_bit, [0, 1, 0, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(test_array[1:3], RealArray.from_values([-1, "2.6457513110646"]))
+        self.assertEqual(list(test_array[::-2]), list(test_matrix)[::-2])
+        self.assertEqual(list(test_array[-3:]), list(test_matrix)[-3:])
+        self.assertEqual(len(test_array[5:2]), 0)
+
+        test_matrix = TIMatrix.open("tests/data/var/Matrix_2x2_exact.8xm")
+        test_array = RealArray(test_matrix.data)
+
+        self.assertEqual(test_array.subtype_id, [0x20, 0x1C, 0x18, 0x1C])
+        self.assertEqual(test_array.decimal(), [entry.decimal() for entry in test_matrix])
+        self.assertEqual(test_array.fraction(), [None, None, Fraction(1, 2), None])
+        self.assertEqual(test_array.radical(), [None, ((3, 10), (0, 1), 1), None, ((4, 5), (2, 3), 7)])
+        self.assertEqual(test_array.get_min_os(), test_matrix.get_min_os())
+
+    def test_csv(self):
+        test_real_list = TIRealList.open("tests/data/var/RealList.8xl")
+        test_real_list.to_csv(buffer := io.StringIO())
+        self.assertEqual(buffer.getvalue(), "-1\r\n2\r\n999\r\n")
+
+        test_from_csv = TIRealList(name="Z")
+        test_from_csv.load_csv(io.StringIO("-1,2\n999,"))
+        self.assertEqual(test_from_csv.calc_data, test_real_list.calc_data)
+
+        with self.assertWarns(UserWarning):
+            test_from_csv.load_csv(io.StringIO("1\n" * 1000))
+
+        self.assertEqual(test_from_csv.length, 999)
+
+        test_comp_list = TIComplexList.open("tests/data/var/ComplexList.8xl")
+        test_comp_list.to_csv(buffer := io.StringIO())
+
+        test_from_csv = TIComplexList(name="I")
+        test_from_csv.load_csv(io.StringIO(buffer.getvalue()))
+        self.assertEqual(test_from_csv.calc_data, test_comp_list.calc_data)
+
+        test_matrix = TIMatrix.open("tests/data/var/Matrix_2x2_exact.8xm")
+        test_matrix.to_csv(buffer := io.StringIO())
+
+        test_from_csv = TIMatrix(name="[B]")
+        test_from_csv.load_csv(io.StringIO(buffer.getvalue()))
+        self.assertEqual(test_from_csv.matrix(), test_matrix.matrix())
+
+        with self.assertWarns(UserWarning):
+            test_from_csv.load_csv(io.StringIO("1,2,3,4,5\n" * 90))
+
+        self.assertEqual((test_from_csv.width, test_from_csv.height), (5, 80))
+
+        values = [939593.00899294, -0.1, 1 / 3, 6.02214076e23]
+        test_from_list = TIRealList(name="Z")
+        test_from_list.load_list([TIReal(value) for value in values])
+
+        test_from_elements = TIRealList(name="Z")
+        test_from_elements.load_elements(values)
+        self.assertEqual(test_from_elements.calc_data, test_from_list.calc_data)
+
+        test_from_csv = TIRealList(name="Z")
+        test_from_csv.load_csv(io.StringIO("\n".join(map(repr, values))))
+        test_from_list.load_list([TIReal(repr(value)) for value in values])
+        self.assertEqual(test_from_csv.calc_data, test_from_list.calc_data)
+
+    @unittest.skipIf(np is None, "NumPy not installed")
+    def test_npy(self):
+        test_matrix = TIMatrix.open("tests/data/var/Matrix_3x3_standard.8xm")
+        test_matrix.save_npy(buffer := io.BytesIO())
+        buffer.seek(0)
+
+        test_from_npy = TIMatrix()
+        test_from_npy.load_npy(buffer)
+        self.assertEqual(test_from_npy.matrix(), test_matrix.matrix())
+
+        test_comp_list = TIComplexList.open("tests/data/var/ComplexList.8xl")
+        test_comp_list.save_npy(buffer := io.BytesIO())
+        buffer.seek(0)
+
+        test_from_npy = TIComplexList(name="I")
+        test_from_npy.load_npy(buffer)
+        self.assertEqual(test_from_npy.calc_data, test_comp_list.calc_data)
+
+        values = [939593.00899294, -0.1, 1 / 3, 6.02214076e23]
+        np.save(buffer := io.BytesIO(), np.array(values))
+        buffer.seek(0)
+
+        test_from_npy = TIRealList(name="Z")
+        test_from_npy.load_npy(buffer)
+
+        test_from_list = TIRealList(name="Z")
+        test_from_list.load_list([TIReal(value) for value in values])
+        self.assertEqual(test_from_npy.calc_data, test_from_list.calc_data)
+
 
 class SettingsTests(unittest.TestCase):
     def test_window(self):
@@ -519,6 +1057,13 @@ class SettingsTests(unittest.TestCase):
         self.assertEqual(test_table.TblMin, TIReal(0.0))
         self.assertEqual(test_table.DeltaTbl, TIReal("1"))
 
+    def test_load_dict(self):
+        test_window = TIWindowSettings.open("tests/data/var/Window.8xw")
+
+        new_window = TIWindowSettings()
+        new_window.load_dict(test_window.dict())
+        self.assertEqual(new_window.dict(), test_window.dict())
+
 
 class GDBTests(unittest.TestCase):
     def test_func_gdb(self):
@@ -575,6 +1120,51 @@ class GDBTests(unittest.TestCase):
 
         self.assertEqual(test_gdb.length, 142)
 
+    def test_batch(self):
+        test_gdb = TIMonoGDB.open("tests/data/var/GraphDataBase.8xd")
+        batch_gdb = copy.copy(test_gdb)
+
+        equation = TIGraphedEquation(test_gdb.Y1, name="Y1")
+        equation.style = GraphStyle.ThickLine
+
+        test_gdb.Xmax = TIReal(5)
+        test_gdb.Y1 = equation
+
+        with batch_gdb.batch():
+            batch_gdb.Xmax = TIReal(5)
+            batch_gdb.Y1 = equation
+
+            self.assertEqual(batch_gdb.Y1.style, GraphStyle.ThickLine)
+            self.assertNotEqual(batch_gdb.bytes(), test_gdb.bytes())
+
+        self.assertEqual(batch_gdb.bytes(), test_gdb.bytes())
+        self.assertEqual(batch_gdb.Y1.style, GraphStyle.ThickLine)
+
+    def test_batch_sharing(self):
+        test_gdb = TIMonoGDB.open("tests/data/var/GraphDataBase.8xd")
+
+        with test_gdb.batch():
+            test_gdb.Xmin = TIReal(-8)
+            test_copy = copy.copy(test_gdb)
+            copy_bytes = test_copy.bytes()
+
+            test_gdb.Xmin = TIReal(-7)
+
+        self.assertEqual(test_copy.Xmin, TIReal(-8))
+        self.assertEqual(test_copy.bytes(), copy_bytes)
+        self.assertEqual(test_gdb.Xmin, TIReal(-7))
+
+        test_program = TIProgram("Disp 1")
+
+        with test_program.batch():
+            test_program.data = b'\xde\x30'
+            view = test_program.data_view()
+
+            test_program.data = b'\xde\x30\x3f\xde\x31'
+
+        self.assertEqual(bytes(view), b'\xde\x30')
+        self.assertEqual(test_program.string(), "Disp 0\nDisp 1")
+
 
 class PictureTests(unittest.TestCase):
     def test_mono_picture(self):
@@ -636,6 +1226,18 @@ class AppVarTests(unittest.TestCase):
         self.assertEqual(test_app_var.name, "FILEIOC")
         self.assertEqual(test_app_var.length, 2578)
 
+    def test_data_view(self):
+        test_app_var = TIAppVar.open("tests/data/var/AppVar.8xv")
+        data_view = test_app_var.data_view()
+
+        self.assertEqual(data_view, test_app_var.data)
+        self.assertEqual(test_app_var.calc_data_view(), test_app_var.calc_data)
+        self.assertTrue(data_view.readonly)
+
+        test_app_var.data = b'\x00'
+        self.assertEqual(len(data_view), 2578)
+        self.assertEqual(test_app_var.data_view(), b'\x00')
+
 
 class GroupTests(unittest.TestCase):
     def test_group(self):
@@ -674,6 +1276,16 @@ class FlashTests(unittest.TestCase):
         self.assertEqual(test_app.binary_flag, 0x01)
         self.assertEqual(type(test_app.data), list)
 
+        with open("tests/data/var/smartpad.8xk", 'rb') as file:
+            data = bytearray(file.read())
+            data[0], data[48] = ord("!"), 0x99
+
+        with Diagnostics() as diagnostics:
+            TIFlashHeader().load_bytes(data)
+
+        self.assertEqual([(record.code, record.offset) for record in diagnostics],
+                         [("magic", 0), ("device-type", 48)])
+
     def test_os(self):
         test_os = TIFlashHeader.open("tests/data/var/TI-84_Plus_CE-Python-OS-5.8.0.0022.8eu")
 
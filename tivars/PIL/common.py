@@ -4,10 +4,9 @@ Common import for PIL plugins
 
 
 import numpy as np
-import warnings
 
 from PIL import Image, ImageFile
-from tivars import TIVar
+from tivars import Diagnostics, TIVar
 from tivars.types.picture import PictureEntry
 
 
@@ -38,9 +37,7 @@ class TIImageFile(ImageFile.ImageFile):
         Loads necessary image information from an opened file
         """
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("error")
-
+        with Diagnostics("error"):
             var = TIVar()
             var.load_bytes(self.fp.read())
 
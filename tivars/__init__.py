@@ -3,6 +3,9 @@ A library for interacting with TI-(e)z80 (82/83/84 series) calculator files
 """
 
 
+from .bulk import *
+from .cache import *
+from .diagnostics import *
 from .flash import *
 from .models import *
 from .tokenizer import *
@@ -10,4 +13,5 @@ from .types import *
 from .var import *
 
 
-__all__ = list({*flash.__all__, *models.__all__, *tokenizer.__all__, *types.__all__, *var.__all__})
+__all__ = list({*bulk.__all__, *cache.__all__, *diagnostics.__all__, *flash.__all__, *models.__all__,
+                *tokenizer.__all__, *types.__all__, *var.__all__})
@@ -0,0 +1,212 @@
+"""
+Bulk operations over many var files
+"""
+
+
+import os
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from functools import partial
+from typing import NamedTuple
+
+from .diagnostics import warn
+from .flash import TIFlashHeader
+from .models import *
+from .var import TIEntry, TIHeader, TIVar
+
+
+class EntryInfo(NamedTuple):
+    """
+    Metadata of a single var entry
+    """
+
+    type_id: int
+    name: str
+    data_length: int
+    archived: bool
+
+
+class VarInfo(NamedTuple):
+    """
+    Metadata of a var file and its entries
+    """
+
+    filename: str
+    magic: str
+    product_id: int
+    entries: tuple[EntryInfo, ...]
+
+
+def scan_file(filename: str) -> VarInfo | None:
+    """
+    Reads the metadata of a var file without reading any entry data
+
+    Only the header and the meta section of each entry are read; entry data sections are skipped.
+
+    :param filename: The filename of the var to scan
+    :return: The metadata of the var, or ``None`` if the file is not a var file
+    """
+
+    with open(filename, 'rb') as file:
+        header = file.read(55)
+
+        magic = TIHeader.magic.converter.get(header[:8])
+        if len(header) < 55 or magic not in {model.magic for model in TIModel.MODELS}:
+            return None
+
+        entry_length = int.from_bytes(header[53:55], 'little')
+
+        entries = []
+        while entry_length > 0:
+            meta_length = int.from_bytes(file.read(2), 'little')
+            meta = file.read(meta_length)
+
+            if len(meta) < TIEntry.base_meta_length:
+                warn(f"The entries of {filename} are truncated; skipping remaining entries.",
+                     BytesWarning)
+                break
+
+            data_length = int.from_bytes(meta[0:2], 'little')
+            type_id = meta[2]
+            name = (TIEntry.get_type(type_id) or TIEntry).name.converter.get(meta[3:11])
+            archived = meta_length >= TIEntry.flash_meta_length and meta[12] == 0x80
+
+            entries.append(EntryInfo(type_id, name, data_length, archived))
+
+            # Skip past the data section
+            file.seek(2 + data_length, 1)
+            entry_length -= 2 + meta_length + 2 + data_length
+
+    return VarInfo(filename, magic, TIHeader.product_id.converter.get(header[10:11]), tuple(entries))
+
+
+def scan(path: str, recursive: bool = True, *, threads: int = None) -> Iterator[VarInfo]:
+    """
+    Scans a directory (or single file) for var files, yielding the metadata of each
+
+    Files which are not var files are skipped, as are files which cannot be read, with a diagnostic for each.
+    If ``threads`` is set, directories are distributed across a thread pool of that size,
+    with at most twice that many directories scanned ahead of the results consumed.
+
+    :param path: The directory or file to scan
+    :param recursive: Whether to scan subdirectories (defaults to ``True``)
+    :param threads: The number of threads to scan with (defaults to scanning in the calling thread)
+    :return: An iterator over the metadata of each var found
+    """
+
+    def walk() -> Iterator[list[str]]:
+        if os.path.isfile(path):
+            yield [path]
+            return
+
+        for root, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            yield [os.path.join(root, filename) for filename in sorted(filenames)]
+
+            if not recursive:
+                break
+
+    def scan_dir(files: list[str]) -> list[VarInfo]:
+        infos = []
+        for filename in files:
+            try:
+                if (info := scan_file(filename)) is not None:
+                    infos.append(info)
+
+                else:
+                    warn(f"{filename} is not a var file; skipping.",
+                         UserWarning, code="not-a-var")
+
+            except OSError as error:
+                warn(f"Could not read {filename} ({error}); skipping.",
+                     UserWarning, code="unreadable")
+
+        return infos
+
+    if threads is None:
+        for files in walk():
+            yield from scan_dir(files)
+
+    else:
+        with ThreadPoolExecutor(threads) as executor:
+            # Run each directory in a copy of this context, so that diagnostics reach the caller's sink
+            futures = deque()
+            for files in walk():
+                futures.append(executor.submit(copy_context().run, scan_dir, files))
+
+                if len(futures) >= 2 * threads:
+                    yield from futures.popleft().result()
+
+            while futures:
+                yield from futures.popleft().result()
+
+
+def _load(kind: str, trusted: bool, errors: str, filename: str) -> TIVar | TIFlashHeader | Exception:
+    try:
+        match kind:
+            case "var":
+                return TIVar.open(filename, trusted=trusted)
+
+            case "flash":
+                return TIFlashHeader.open(filename)
+
+    except Exception as error:
+        if errors == "raise":
+            raise
+
+        return error
+
+
+def load_many(paths: Iterable[str], workers: int = None, kind: str = "var", *,
+              ordered: bool = True, trusted: bool = False,
+              errors: str = "raise") -> Iterator[tuple[str, TIVar | TIFlashHeader | Exception]]:
+    """
+    Loads many var or flash files across a pool of worker processes
+
+    Each worker is started once and handles many files; token tables are loaded when a worker first imports
+    this package (or inherited from the calling process if forked), never per file.
+    Loaded objects are sent back to the calling process, so any warnings are issued within the workers.
+
+    Files which fail to load are handled according to ``errors``:
+
+        - ``raise``: Raise the exception of the first failed file, abandoning any remaining files
+        - ``return``: Yield the exception of each failed file in place of its loaded object
+
+    :param paths: The filenames to load
+    :param workers: The number of worker processes (defaults to the number of processors)
+    :param kind: The kind of file to load, ``var`` or ``flash`` (defaults to ``var``)
+    :param ordered: Whether to yield results in the order of ``paths`` or as each finishes (defaults to ``True``)
+    :param trusted: Whether to skip validation of var files (defaults to ``False``)
+    :param errors: How to handle files which fail to load, ``raise`` or ``return`` (defaults to ``raise``)
+    :return: An iterator over each filename and the `TIVar` or `TIFlashHeader` loaded from it (or its exception)
+    """
+
+    if kind not in ("var", "flash"):
+        raise ValueError(f"unrecognized file kind '{kind}'")
+
+    if errors not in ("raise", "return"):
+        raise ValueError(f"unrecognized error handling '{errors}'")
+
+    filenames = list(paths)
+    load = partial(_load, kind, trusted, errors)
+
+    executor = ProcessPoolExecutor(workers)
+
+    try:
+        if ordered:
+            chunksize = max(1, len(filenames) // (4 * (workers or os.cpu_count() or 1)))
+            yield from zip(filenames, executor.map(load, filenames, chunksize=chunksize))
+
+        else:
+            futures = {executor.submit(load, filename): filename for filename in filenames}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+__all__ = ["scan", "scan_file", "load_many", "VarInfo", "EntryInfo"]
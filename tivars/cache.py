@@ -0,0 +1,152 @@
+"""
+Content-addressed caching of parsed files
+"""
+
+
+import copy
+import hashlib
+import threading
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple, TypeVar
+
+from .diagnostics import Diagnostic, Diagnostics, warn
+
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Hit and miss statistics of a `ParseCache`
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    nbytes: int
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed objects keyed by a hash of the bytes they were parsed from
+
+    Each lookup returns a copy of the cached object (see `TIVar.__copy__`), so cached objects are never modified.
+    Diagnostics issued while parsing are stored alongside each object and issued again on every hit.
+    They are issued in the caller's `Diagnostics` sink, so ``Diagnostics("error")`` raises on the first of them
+    whether or not the object was cached.
+
+    To cache every var or flash header loaded from bytes, assign a cache to `TIVar.parse_cache`
+    or `TIFlashHeader.parse_cache`. Caches are safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int | None = 128, max_bytes: int = None):
+        """
+        Creates an empty cache with specified size limits
+
+        :param maxsize: The maximum number of cached objects, or ``None`` for no limit (defaults to ``128``)
+        :param max_bytes: The maximum total length of the bytes parsed into cached objects (defaults to no limit)
+        """
+
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[tuple, tuple[object, tuple[Diagnostic, ...], int]] = OrderedDict()
+        self._nbytes = 0
+        self._hits = self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def digest(data: bytes) -> bytes:
+        """
+        Hashes bytes for use in a cache key
+
+        :param data: The bytes to hash
+        :return: The 128-bit BLAKE2b digest of ``data``
+        """
+
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def fetch(self, data: bytes, parse: Callable[[], T], *key) -> T:
+        """
+        Fetches a copy of the object parsed from some bytes, parsing and caching it if not yet cached
+
+        :param data: The bytes the object is parsed from
+        :param parse: A function which parses ``data`` into a new object
+        :param key: Additional values which distinguish objects parsed from the same bytes, such as their type
+        :return: A copy of the object parsed from ``data``
+        """
+
+        key = *key, self.digest(data)
+
+        with self._lock:
+            if (cached := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+        if cached is None:
+            try:
+                with Diagnostics() as diagnostics:
+                    obj = parse()
+
+            except Exception:
+                # Anything issued before the failure still belongs to the caller
+                self._replay(diagnostics)
+                raise
+
+            cached = obj, tuple(diagnostics), len(data)
+            self._store(key, cached)
+
+        obj, records, _ = cached
+        self._replay(records)
+
+        return copy.copy(obj)
+
+    @staticmethod
+    def _replay(records):
+        for diagnostic in records:
+            warn(diagnostic.message, diagnostic.category,
+                 code=diagnostic.code, offset=diagnostic.offset, stacklevel=3)
+
+    def _store(self, key: tuple, cached: tuple[object, tuple[Diagnostic, ...], int]):
+        with self._lock:
+            self._misses += 1
+
+            if self.max_bytes is not None and cached[2] > self.max_bytes:
+                return
+
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._nbytes -= previous[2]
+
+            self._entries[key] = cached
+            self._nbytes += cached[2]
+
+            while (self.maxsize is not None and len(self._entries) > self.maxsize) or \
+                    (self.max_bytes is not None and self._nbytes > self.max_bytes):
+                self._nbytes -= self._entries.popitem(last=False)[1][2]
+
+    def clear(self):
+        """
+        Removes all cached objects and resets the statistics of this cache
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        :return: The hit and miss statistics and current size of this cache
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries), self._nbytes)
+
+
+__all__ = ["ParseCache", "CacheInfo"]
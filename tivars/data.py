@@ -24,11 +24,14 @@ This module implements two primary means of data interface:
 
 import copy
 import inspect
+import struct
 
 from collections.abc import Callable
+from functools import wraps
 from math import ceil
-from typing import TypeVar
-from warnings import warn
+from typing import TypeVar, get_origin
+
+from .diagnostics import warn
 
 
 _T = TypeVar('_T')
@@ -120,7 +123,12 @@ class Data(Bytes):
         """
 
         if instance is not None:
-            instance.version = instance.get_version(value)
+            # Within a batch, the version is found once the batch ends
+            if (batch := getattr(instance, "_batch", None)) is not None:
+                batch["version"] = True
+
+            else:
+                instance.version = instance.get_version(value)
 
         return super().set(value)
 
@@ -256,7 +264,7 @@ class Bits:
     """
 
     def __class_getitem__(cls, item: slice):
-        indices = range(*item.indices(8))
+        indices = sorted(range(*item.indices(8)))
 
         class BitSlice(Converter):
             """
@@ -268,6 +276,10 @@ class Bits:
             _T = int
 
             mask = sum(1 << i for i in indices)
+            shift = indices[0] if indices else 0
+            width = len(indices)
+
+            contiguous = mask == ((1 << width) - 1) << shift
 
             @classmethod
             def get(cls, data: bytes, **kwargs) -> _T:
@@ -278,12 +290,14 @@ class Bits:
                 :return: The sliced bits in ``data`` joined without gaps as an integer
                 """
 
-                value = ""
-                for index, bit in enumerate(f"{data[0]:08b}"[::-1]):
-                    if index in indices:
-                        value += bit
+                if cls.contiguous:
+                    return (data[0] & cls.mask) >> cls.shift
+
+                value = 0
+                for bit, index in enumerate(indices):
+                    value |= (data[0] >> index & 1) << bit
 
-                return int(value[::-1], 2)
+                return value
 
             @classmethod
             def set(cls, value: _T, *, current: bytes = None, **kwargs) -> bytes:
@@ -295,24 +309,21 @@ class Bits:
                 :return: The bytes in ``value`` fit into the section
                 """
 
-                data = 0
-                bits = iter(f"{value % 256:08b}"[::-1])
+                bits = value % 256
+                if bits >> cls.width:
+                    warn(f"Value {value} has too many bits for this buffer.",
+                         BytesWarning)
 
-                for index in range(8):
-                    if index in indices:
-                        data += int(next(bits)) << index
+                if cls.contiguous:
+                    data = bits << cls.shift & cls.mask
 
-                    else:
-                        data += current[0] & (1 << index)
+                else:
+                    data = 0
+                    for bit, index in enumerate(indices):
+                        data |= (bits >> bit & 1) << index
 
-                try:
-                    while 1:
-                        if next(bits) == "1":
-                            warn(f"Value {value} has too many bits for this buffer.",
-                                 BytesWarning)
-
-                except StopIteration:
-                    pass
+                if cls.mask != 0xFF:
+                    data |= current[0] & ~cls.mask
 
                 return bytes([data])
 
@@ -406,6 +417,19 @@ class Section:
     def _get_raw(self, instance) -> bytes:
         return getattr(instance.raw, self._name, None)
 
+    def view(self, instance) -> memoryview:
+        """
+        Views the bytes of this section within an instance without copying them
+
+        Sections are replaced rather than modified when set, so the view is unaffected by later writes.
+
+        :param instance: The instance which contains this section
+        :return: A read-only ``memoryview`` of the section's bytes
+        """
+
+        _disown(instance, self._name)
+        return memoryview(self._get_raw(instance)).toreadonly()
+
     def _set_raw(self, instance, value: _T) -> _T:
         value = self._set(value, instance=instance, length=self._length, current=self._get_raw(instance))
 
@@ -427,6 +451,14 @@ class Section:
 
         return self._name
 
+    @property
+    def converter(self) -> type[Converter]:
+        """
+        :return: The type converter of this section
+        """
+
+        return self._converter
+
     @property
     def length(self) -> int | None:
         """
@@ -487,7 +519,23 @@ class View(Section):
             self._length = len(range(*self._indices.indices(self._target.length)))
 
     def __set__(self, instance, value: _T):
-        getattr(instance.raw, self._target.name)[self._indices] = self._set_raw(instance, value)
+        # Converters may write to the target themselves, so convert before reading it
+        value = self._set_raw(instance, value)
+
+        # Write into a new buffer, since the target may be shared with copies of the instance
+        # Once the instance owns that buffer, write in place until it is shared again
+        name = self._target.name
+        data = getattr(instance.raw, name)
+        owned = getattr(instance.raw, "owned", None)
+
+        if owned is None or name not in owned:
+            data = bytearray(data)
+
+        data[self._indices] = value
+
+        setattr(instance.raw, name, data)
+        if owned is not None:
+            owned.add(name)
 
     def __getitem__(self, indices: slice) -> 'View':
         return self.__class__(self._target, self._converter, indices)
@@ -498,6 +546,10 @@ class View(Section):
     def _get_raw(self, instance) -> bytes:
         return getattr(instance.raw, self._target.name)[self._indices]
 
+    def view(self, instance) -> memoryview:
+        _disown(instance, self._target.name)
+        return memoryview(getattr(instance.raw, self._target.name))[self._indices].toreadonly()
+
     @property
     def target(self) -> 'Section':
         return self._target
@@ -507,6 +559,111 @@ class View(Section):
         return self._indices
 
 
+class Layout:
+    """
+    Precompiled ``struct`` layout for consecutive fixed-width data sections
+
+    A layout is declared from a sequence of `Section` instances, whose lengths determine the widths of its fields.
+    Integers can be interspersed to declare unnamed fields of that width, such as lengths derived from other sections.
+    All named fields are read or written in a single pass:
+
+    .. python::
+
+        layout = Layout(magic, 2, name)
+        layout.unpack(raw, buffer)
+
+    The sections must all have a fixed length.
+    """
+
+    def __init__(self, *fields: Section | int):
+        """
+        Define a new layout given its fields
+
+        :param fields: The sections or unnamed field widths in the layout, in order
+        """
+
+        self._fields = fields
+        self._struct = struct.Struct("".join(f"{field if isinstance(field, int) else field.length}s"
+                                             for field in fields))
+
+    @property
+    def size(self) -> int:
+        """
+        :return: The total width of this layout
+        """
+
+        return self._struct.size
+
+    def unpack(self, raw, buffer, offset: int = 0) -> tuple[bytes, ...]:
+        """
+        Reads each field of this layout from a buffer, storing each named field in a ``Raw`` container
+
+        :param raw: The ``Raw`` container to store to
+        :param buffer: The buffer to read from
+        :param offset: The offset of the layout within ``buffer`` (defaults to ``0``)
+        :return: The bytes of every field, including unnamed fields
+        """
+
+        values = self._struct.unpack_from(buffer, offset)
+
+        for field, value in zip(self._fields, values):
+            if not isinstance(field, int):
+                setattr(raw, field.name, value)
+
+        return values
+
+    def pack(self, raw, *unnamed: bytes) -> bytes:
+        """
+        Writes each field of this layout from a ``Raw`` container
+
+        :param raw: The ``Raw`` container to read from
+        :param unnamed: The bytes of each unnamed field, in order
+        :return: The bytes of the layout
+        """
+
+        it = iter(unnamed)
+        return self._struct.pack(*(next(it) if isinstance(field, int) else getattr(raw, field.name)
+                                   for field in self._fields))
+
+
+def _disown(instance, name: str):
+    # A buffer which has been handed out must not be written in place again
+    if (owned := getattr(instance.raw, "owned", None)) is not None:
+        owned.discard(name)
+
+
+def cached(func: Callable) -> Callable:
+    """
+    Decorator which caches the result of a parameterless method in its instance's ``raw`` container
+
+    The ``Raw`` container must have a ``cache`` slot which is reset whenever a data section is written.
+    Cached values are thus only recomputed after the instance's data changes.
+
+    :param func: The method to cache
+    :return: The cached method
+    """
+
+    key = func.__qualname__
+
+    @wraps(func)
+    def wrapper(self):
+        # Hold onto the current cache so that a value computed across a concurrent write is never kept
+        try:
+            cache = self.raw.cache
+
+        except AttributeError:
+            cache = self.raw.cache = {}
+
+        try:
+            return cache[key]
+
+        except KeyError:
+            value = cache[key] = func(self)
+            return value
+
+    return wrapper
+
+
 class Dock:
     """
     Base class to inherit to implement the loader system
@@ -514,20 +671,29 @@ class Dock:
 
     loaders = {}
 
+    _dispatch = {}
+
     def load(self, data):
         """
         Loads data into an instance by delegating to `Loader` methods based on the input's type
 
+        The loaders which accept each input type are resolved once per class and cached.
+
         :param data: Any type which the instance might accept
         """
-        for loader_types, loader in self.loaders.items():
-            if any(isinstance(data, loader_type) for loader_type in loader_types):
-                try:
-                    loader(self, data)
-                    return
 
-                except NotImplementedError:
-                    continue
+        key = type(self), type(data)
+        if (loaders := Dock._dispatch.get(key)) is None:
+            loaders = Dock._dispatch[key] = [loader for loader_types, loader in self.loaders.items()
+                                             if isinstance(data, loader_types)]
+
+        for loader in loaders:
+            try:
+                loader(self, data)
+                return
+
+            except NotImplementedError:
+                continue
 
         raise TypeError(f"could not find valid loader for type {type(data)}")
 
@@ -554,16 +720,19 @@ class Loader:
         pass
 
     def __class_getitem__(cls, item: tuple[type, ...] | type) -> type:
-        try:
-            return type("Loader", (Loader,), {"types": tuple(item)})
+        if not isinstance(item, tuple):
+            item = item,
 
-        except TypeError:
-            return type("Loader", (Loader,), {"types": (item,)})
+        # Generic aliases are dispatched on their origin types
+        types = tuple(get_origin(loader_type) or loader_type for loader_type in item)
+        return type("Loader", (Loader,), {"types": types})
 
     def __set_name__(self, owner, name: str):
         owner.loaders = owner.loaders | {self.types: self._func}
         setattr(owner, name, self._func)
 
+        Dock._dispatch.clear()
+
 
-__all__ = ["Section", "View", "Dock", "Loader",
+__all__ = ["Section", "View", "Layout", "Dock", "Loader", "cached",
            "Converter", "Bytes", "Data", "SizedData", "Boolean", "Integer", "String", "Bits"]
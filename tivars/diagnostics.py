@@ -0,0 +1,120 @@
+"""
+Structured diagnostics for anomalies found while parsing
+"""
+
+
+import warnings
+
+from contextvars import ContextVar
+from typing import NamedTuple
+
+
+class Diagnostic(NamedTuple):
+    """
+    A single anomaly found while parsing
+    """
+
+    code: str | None
+    offset: int | None
+    message: str
+    category: type[Warning]
+
+
+class Diagnostics:
+    """
+    Context manager which collects diagnostics issued within its context
+
+    By default, diagnostics are issued as warnings.
+    Within a `Diagnostics` context, they are instead handled according to its ``action``:
+
+        - ``collect``: Append each diagnostic to `Diagnostics.records`
+        - ``ignore``: Discard each diagnostic
+        - ``error``: Raise each diagnostic as an exception of its category
+
+    Contexts are local to the current thread or task, and nested contexts take precedence over outer ones.
+    Unlike ``warnings.catch_warnings``, entering a context modifies no global state,
+    so contexts are safe to use from many threads at once.
+    """
+
+    def __init__(self, action: str = "collect"):
+        """
+        Creates a new diagnostics context with a specified action
+
+        :param action: How to handle diagnostics issued within the context (defaults to ``collect``)
+        """
+
+        if action not in ("collect", "ignore", "error"):
+            raise ValueError(f"unrecognized diagnostics action '{action}'")
+
+        self.action = action
+        self.records: list[Diagnostic] = []
+
+        self._token = None
+
+    def __enter__(self) -> 'Diagnostics':
+        self._token = _sink.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _sink.reset(self._token)
+        self._token = None
+
+    def __bool__(self) -> bool:
+        """
+        :return: Whether any diagnostics were collected
+        """
+
+        return bool(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, diagnostic: Diagnostic):
+        """
+        Handles a diagnostic issued within this context
+
+        :param diagnostic: The diagnostic to handle
+        """
+
+        match self.action:
+            case "collect":
+                self.records.append(diagnostic)
+
+            case "error":
+                raise diagnostic.category(diagnostic.message)
+
+    def emit(self):
+        """
+        Issues each collected diagnostic as a warning
+        """
+
+        for diagnostic in self.records:
+            warnings.warn(diagnostic.message, diagnostic.category, stacklevel=2)
+
+
+_sink: ContextVar[Diagnostics | None] = ContextVar("diagnostics", default=None)
+
+
+def warn(message: str, category: type[Warning] = UserWarning, *,
+         code: str = None, offset: int = None, stacklevel: int = 1):
+    """
+    Issues a diagnostic to the current `Diagnostics` context, or as a warning if there is none
+
+    :param message: The message of the diagnostic
+    :param category: The warning category of the diagnostic (defaults to ``UserWarning``)
+    :param code: A short identifier for the kind of diagnostic (defaults to ``None``)
+    :param offset: The byte offset of the anomaly, if known (defaults to ``None``)
+    :param stacklevel: The stack level to attribute warnings to (defaults to the caller of this function)
+    """
+
+    if (sink := _sink.get()) is None:
+        warnings.warn(message, category, stacklevel=stacklevel + 1)
+
+    else:
+        sink.add(Diagnostic(code, offset, message, category))
+
+
+__all__ = ["Diagnostic", "Diagnostics"]
@@ -7,18 +7,18 @@ This module implements two general-use converters:
 
         Each element of an enum is assigned a literal that represents its value in a data section.
 
-    -   `Flags`, which converts between a bitfield and a ``dict`` of bitsets.
+    -   `Flags`, which converts between a bitfield and a mapping of bitsets.
 
-        The ``dict`` representation permits the use of ``dict`` update notation to set flags with a single operation.
+        The mapping representation permits the use of ``dict`` update notation to set flags with a single operation.
 """
 
 
 from collections.abc import Mapping
 from functools import total_ordering
 from math import ceil
-from warnings import warn
 
 from .data import *
+from .diagnostics import warn
 
 
 class Enum(Converter):
@@ -32,6 +32,17 @@ class Enum(Converter):
 
     _all = []
 
+    _names = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Names are tabulated in alphabetical order, so the first name for each value wins
+        cls._names = {}
+        for attr in dir(cls):
+            if not attr.startswith("_") and isinstance(value := getattr(cls, attr), int):
+                cls._names.setdefault(value, attr)
+
     @classmethod
     def get(cls, data: bytes, **kwargs) -> _T:
         """
@@ -67,49 +78,105 @@ class Enum(Converter):
         :return: A name in this enum with value ``value`` or ``None``
         """
 
-        return next(filter(lambda attr: not attr.startswith("_") and getattr(cls, attr) == value, dir(cls)), None)
+        return cls._names.get(value)
 
 
 @total_ordering
-class Flags(Converter, dict, Mapping[int, int]):
+class Flags(Converter, Mapping[int, int]):
     """
     Base class for flag types
 
     Flags are bitfields in a byte that are set or cleared using dict update notation.
+    The bitfields are stored as a single integer, and are read as a mapping from each bit to its value.
     """
 
     _T = 'Flags'
 
-    def __init__(self, bitsets: Mapping[int, int] = None, *, width: int = 8):
+    def __init__(self, bitsets: Mapping[int, int] | int = None, *, width: int = 8):
         """
         Creates an empty `Flags` instance with a given initial state and width
 
-        :param bitsets: The initial state of these flags
+        :param bitsets: The initial state of these flags, as a mapping of bitsets or an integer
         :param width: The number of bitfields used for these flags (defaults to ``8``)
         """
 
-        if bitsets is None:
-            bitsets = {bit: 0 for bit in range(width)}
+        self._value = 0
+        self._width = width
+
+        if isinstance(bitsets, int):
+            self._value = bitsets
+            self._width = max(width, ceil(bitsets.bit_length() / 8) * 8)
+
+        elif bitsets is not None:
+            self._width = ceil((max(bitsets.keys(), default=0) + 1) / 8) * 8
+            self._update(bitsets)
 
-        else:
-            bitsets = {bit: 0 for bit in range(ceil((max(bitsets.keys(), default=0) + 1) / 8) * 8)} | bitsets
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Flags):
+            return self._value == other._value and self._width == other._width
 
-        super().__init__({bit: value % 2 for bit, value in bitsets.items()})
+        return super().__eq__(other)
 
     def __gt__(self, other) -> bool:
         return int(self) > int(other)
 
     def __int__(self) -> int:
-        return int(str(self), 2)
+        return self._value
 
     def __str__(self) -> str:
-        return ''.join([str(bit) for bit in self.values()][::-1])
+        return f"{self._value:0{self._width}b}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)})"
+
+    def __getitem__(self, bit: int) -> int:
+        if not 0 <= bit < self._width:
+            raise KeyError(bit)
+
+        return self._value >> bit & 1
+
+    def __setitem__(self, bit: int, value: int):
+        self._update({bit: value})
+
+    def __iter__(self):
+        return iter(range(self._width))
+
+    def __len__(self) -> int:
+        return self._width
 
     def __contains__(self, bitsets: Mapping[int, int]) -> bool:
-        return all(self[bit] == int(bool(bitsets[bit])) for bit in bitsets)
+        mask = expected = 0
+        for bit, value in bitsets.items():
+            mask |= 1 << bit
+            expected |= bool(value) << bit
+
+        return self._value & mask == expected
 
     has = __contains__
 
+    def __or__(self, bitsets: Mapping[int, int]) -> 'Flags':
+        flags = type(self)(self._value, width=self._width)
+        flags._update(bitsets)
+        return flags
+
+    def __ror__(self, bitsets: Mapping[int, int]) -> 'Flags':
+        return type(self)(bitsets) | self
+
+    def __ior__(self, bitsets: Mapping[int, int]) -> 'Flags':
+        self._update(bitsets)
+        return self
+
+    def _update(self, bitsets: Mapping[int, int]):
+        for bit, value in bitsets.items():
+            if bit >= self._width:
+                self._width = ceil((bit + 1) / 8) * 8
+
+            if value % 2:
+                self._value |= 1 << bit
+
+            else:
+                self._value &= ~(1 << bit)
+
     @classmethod
     def get(cls, data: bytes, **kwargs) -> _T:
         """
@@ -119,7 +186,7 @@ class Flags(Converter, dict, Mapping[int, int]):
         :return: A `Flags` instance with bitfields given by ``data``
         """
 
-        return cls({bit: int(value) for bit, value in enumerate(f"{int.from_bytes(data, 'little'):b}"[::-1])})
+        return cls(int.from_bytes(data, 'little'), width=8 * len(data))
 
     @classmethod
     def set(cls, value: _T, **kwargs) -> bytes:
@@ -3,12 +3,16 @@ The fundamental flash file components
 """
 
 
+import copy
+import hashlib
+
 from io import BytesIO
 from sys import version_info
 from typing import BinaryIO
-from warnings import warn
 
+from .cache import ParseCache
 from .data import *
+from .diagnostics import Diagnostics, warn
 from .flags import *
 from .models import *
 from .numeric import BCD
@@ -269,19 +273,19 @@ class TIFlashBlock(Dock):
 
         if self.block_type not in [b'00', b'01', b'02']:
             warn(f"The block type ({self.block_type}) is not recognized.",
-                 BytesWarning)
+                 BytesWarning, code="block-type")
 
         self.raw.data = data.read(size)
         if len(self.raw.data) != size:
             warn(f"The block data size is incorrect (expected {size}, got {len(self.raw.data)}.",
-                 BytesWarning)
+                 BytesWarning, code="data-length")
 
         # Check² sum
         checksum = data.read(2)
 
         if checksum != self.checksum:
             warn(f"The checksum is incorrect (expected {self.checksum}, got {checksum}).",
-                 BytesWarning)
+                 BytesWarning, code="checksum")
 
     def bytes(self) -> bytes:
         """
@@ -346,6 +350,13 @@ class TIFlashHeader(Dock):
     The file extension used for this header per-model
     """
 
+    _model_extensions = {}
+
+    parse_cache: ParseCache = None
+    """
+    The cache of headers parsed from bytes, if any (see `ParseCache`)
+    """
+
     _type_id = None
     _type_ids = {}
 
@@ -358,10 +369,31 @@ class TIFlashHeader(Dock):
 
         The `Raw` class must also contain a `bytes()` method specifying the order and visibility of the data sections.
         Additional methods can also be included, but should be callable from the outer class.
+
+        Values derived from the data sections can be stored in ``cache``, which is reset whenever a section is written.
         """
 
         __slots__ = "magic", "revision", "binary_flag", "object_type", "date", "name", "devices", "product_id", \
-            "calc_data"
+            "calc_data", "cache"
+
+        def __copy__(self) -> 'TIFlashHeader.Raw':
+            """
+            :return: A copy of this container which shares its sections and cached values
+            """
+
+            new = object.__new__(self.__class__)
+            for name in self.__slots__:
+                if hasattr(self, name):
+                    object.__setattr__(new, name, getattr(self, name))
+
+            object.__setattr__(new, "cache", dict(getattr(self, "cache", {})))
+            return new
+
+        def __setattr__(self, name: str, value):
+            super().__setattr__(name, value)
+
+            if name != "cache":
+                super().__setattr__("cache", {})
 
         @property
         def calc_data_size(self) -> bytes:
@@ -449,6 +481,45 @@ class TIFlashHeader(Dock):
         if register:
             TIFlashHeader.register(cls, override)
 
+        cls._model_extensions = {model: cls.extensions[nearest] for model in TIModel.MODELS
+                                 if (nearest := model.nearest(cls.extensions)) is not None}
+
+    def __copy__(self) -> Self:
+        """
+        :return: A copy of this header
+        """
+
+        new = object.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.raw = copy.copy(self.raw)
+        return new
+
+    def __eq__(self, other: 'TIFlashHeader') -> bool:
+        """
+        Determines if two headers are the same type and have the same bytes
+
+        Headers are compared by their lengths, then by their content hashes (see `TIFlashHeader.content_hash`).
+
+        :param other: The header to check against
+        :return: Whether this header is equal to ``other``
+        """
+
+        try:
+            return self.__class__ == other.__class__ and len(self) == len(other) and \
+                self.content_hash() == other.content_hash()
+
+        except AttributeError:
+            return False
+
+    def __hash__(self) -> int:
+        """
+        Hashes this header by its content hash
+
+        :return: The hash of this header
+        """
+
+        return hash(self.content_hash())
+
     def __len__(self) -> int:
         """
         :return: The total length of this header's bytes
@@ -456,6 +527,17 @@ class TIFlashHeader(Dock):
 
         return 78 + self.calc_data_size + 2 * self._has_checksum
 
+    def __reduce__(self) -> tuple:
+        """
+        :return: The class and bytes of this header, from which it is rebuilt without validation when unpickled
+        """
+
+        return self.__class__, (), self.bytes()
+
+    def __setstate__(self, state: bytes):
+        with Diagnostics("ignore"):
+            self.load_bytes(state)
+
     @Section(8, String)
     def magic(self) -> str:
         """
@@ -611,7 +693,9 @@ class TIFlashHeader(Dock):
         :param override: A type ID to use for registry that differs from that of the var type
         """
 
-        cls._type_ids[var_type._type_id if override is None else override] = var_type
+        # Replace rather than mutate the registry so that concurrent lookups never see it change size
+        TIFlashHeader._type_ids = TIFlashHeader._type_ids | \
+            {var_type._type_id if override is None else override: var_type}
 
     def extension(self, model: TIModel = TI_84PCE) -> str:
         """
@@ -623,17 +707,11 @@ class TIFlashHeader(Dock):
 
         if not model.has(TIFeature.Flash):
             warn(f"The {model} does not support flash files.",
-                 UserWarning)
-
-        extension = ""
-        for min_model in reversed(TIModel.MODELS):
-            if model in self.extensions and min_model <= model:
-                extension = self.extensions[model]
-                break
+                 UserWarning, code="model")
 
-        if not extension:
+        if not (extension := self._model_extensions.get(model)):
             warn(f"The {model} does not support this var type.",
-                 UserWarning)
+                 UserWarning, code="model")
 
             return self.extensions[None]
 
@@ -656,21 +734,38 @@ class TIFlashHeader(Dock):
         """
         Loads a byte string or bytestream into this header
 
+        If a `TIFlashHeader.parse_cache` is set, a copy of the header cached for identical bytes is loaded instead.
+
         :param data: The bytes to load
         """
 
         if hasattr(data, "read"):
-            data = BytesIO(data.read())
+            data = data.read()
 
-        else:
-            data = BytesIO(data)
+        if self.parse_cache is None:
+            self._load_bytes(data)
+            return
+
+        header = self.parse_cache.fetch(data, lambda: self._parse(data), self.__class__)
+        self.__class__ = header.__class__
+        self.raw = header.raw
+        self._has_checksum = header._has_checksum
+
+    @classmethod
+    def _parse(cls, data: bytes) -> 'TIFlashHeader':
+        header = cls()
+        header._load_bytes(data)
+        return header
+
+    def _load_bytes(self, data: bytes):
+        data = BytesIO(data)
 
         # Read magic
         self.raw.magic = data.read(8)
 
         if self.magic != "**TIFL**":
             warn(f"The header has signature '{self.magic}', expected '**TIFL**'.",
-                 BytesWarning)
+                 BytesWarning, code="magic", offset=0)
 
         self.raw.revision = data.read(2)
         self.raw.binary_flag = data.read(1)
@@ -685,14 +780,14 @@ class TIFlashHeader(Dock):
         if name_length != self.name_length:
             warn(f"The header name length ({name_length}) doesn't match the length of the name "
                  f"(|{self.name}| = {self.name_length}).",
-                 BytesWarning)
+                 BytesWarning, code="name-length", offset=16)
 
         # Read types
         self.raw.devices = data.read(1)
 
         if self.device_type not in DeviceType.DEVICES:
             warn(f"The device type ({self.device_type}) is not recognized.",
-                 BytesWarning)
+                 BytesWarning, code="device-type", offset=48)
 
         # Read and check type ID
         self.raw.devices += data.read(1)
@@ -700,12 +795,12 @@ class TIFlashHeader(Dock):
         if self._type_id is not None and self.type_id != self._type_id:
             if subclass := TIFlashHeader.get_type(self.type_id):
                 warn(f"The header type is incorrect (expected {type(self)}, got {subclass}).",
-                     BytesWarning)
+                     BytesWarning, code="header-type", offset=49)
 
             else:
                 warn(f"The header type is incorrect (expected {type(self)}, got an unknown type). "
                      f"Load the header into a TIFlashHeader instance if you don't know the header type.",
-                     BytesWarning)
+                     BytesWarning, code="header-type", offset=49)
 
         device_bytes = data.read(23)
         self.raw.devices += device_bytes.rstrip(b'\x00')
@@ -717,7 +812,7 @@ class TIFlashHeader(Dock):
 
         if len(self.calc_data) != data_size:
             warn(f"The data section has an unexpected length (expected {data_size}, got {len(self.calc_data)}).",
-                 BytesWarning)
+                 BytesWarning, code="data-length")
 
         # Check² sum
         checksum = data.read(2)
@@ -725,7 +820,7 @@ class TIFlashHeader(Dock):
         if checksum:
             if checksum != self.checksum:
                 warn(f"The checksum is incorrect (expected {self.checksum}, got {checksum}).",
-                     BytesWarning)
+                     BytesWarning, code="checksum")
 
         else:
             self._has_checksum = False
@@ -739,6 +834,18 @@ class TIFlashHeader(Dock):
 
         return self.raw.bytes() if self._has_checksum else self.raw.bytes()[:-2]
 
+    @cached
+    def content_hash(self) -> bytes:
+        """
+        Computes a stable hash of this header's content
+
+        The hash is only recomputed after the header changes.
+
+        :return: The 256-bit BLAKE2b digest of this header's bytes
+        """
+
+        return hashlib.blake2b(self.bytes(), digest_size=32).digest()
+
     @Loader[BinaryIO]
     def load_from_file(self, file: BinaryIO, *, offset: int = 0):
         """
@@ -772,11 +879,11 @@ class TIFlashHeader(Dock):
                 if remaining.startswith(b"**TIFL**"):
                     warn("The selected flash file contains multiple headers; only the first will be loaded. "
                          "Use load_from_file to select a particular header.",
-                         UserWarning)
+                         UserWarning, code="extra-data")
 
                 else:
                     warn(f"The selected flash file contains unexpected additional data: {remaining}.",
-                         BytesWarning)
+                         BytesWarning, code="extra-data")
 
         return header
 
@@ -805,11 +912,11 @@ class TIFlashHeader(Dock):
 
             elif self.type_id != 0xFF:
                 warn(f"Type ID 0x{self.type_id:02x} is not recognized; no coercion will occur.",
-                     BytesWarning)
+                     BytesWarning, code="type-id")
 
             else:
                 warn("Type ID is 0xFF; no coercion will occur.",
-                     UserWarning)
+                     UserWarning, code="type-id")
 
 
 __all__ = ["DeviceType", "BCDDate", "BCDRevision", "TIFlashBlock", "TIFlashHeader"]
@@ -13,4 +13,4 @@ __all__ = ["TI_82",
            "TI_84PT", "TI_82A",
            "TI_84PCSE",
            "TI_84PCE", "TI_84PCET", "TI_83PCE", "TI_83PCEEP", "TI_84PCEPY", "TI_84PCETPE", "TI_82AEP",
-           "TIFeature", "TIModel", "OsVersion", "OsVersions"]
+           "TIFeature", "TIModel", "OsVersion", "OsVersions", "os_rank"]
@@ -5,9 +5,11 @@ Model and feature definitions
 
 import os
 
+from collections.abc import Iterable
 from functools import total_ordering
 
 from tivars.flags import *
+from tivars.token import os_rank
 from tivars.tokens.scripts.parse import MODEL_ORDER, OsVersion, Tokens
 from tivars.trie import *
 
@@ -47,6 +49,10 @@ class TIModel:
     def __hash__(self):
         return hash(self.name)
 
+    def __reduce__(self) -> str:
+        # Models are singletons, so they are pickled by reference to their constants
+        return self.name.translate(str.maketrans("+-.:", "P___"))
+
     def __str__(self):
         return self.name
 
@@ -68,6 +74,24 @@ class TIModel:
 
         return feature in self.features
 
+    def nearest(self, models: Iterable['TIModel']) -> 'TIModel | None':
+        """
+        Finds the model among a collection of models which most closely precedes this model
+
+        This model is chosen if present.
+        Otherwise, the latest preceding model is chosen, preferring models with this model's native language.
+
+        :param models: The models to choose from (``None`` is ignored)
+        :return: The nearest model in ``models`` which precedes this model, or ``None`` if there is none
+        """
+
+        candidates = [model for model in models if model is not None and model.order <= self.order]
+        if self in candidates:
+            return self
+
+        return max(candidates, default=None,
+                   key=lambda model: (model.order, model.lang == self.lang, -TIModel.MODELS.index(model)))
+
     def OS(self, version: str = "") -> OsVersion:
         """
         An `OsVersion` with this model as its model and a supplied version
@@ -78,6 +102,16 @@ class TIModel:
 
         return OsVersion(self.name, version)
 
+    def rank(self, version: str = "") -> int:
+        """
+        The integer rank of an OS version for this model (see `os_rank`)
+
+        :param version: An OS version number (defaults to the model's earliest OS)
+        :return: The rank of the `OsVersion` for this model and ``version``
+        """
+
+        return os_rank(self.OS(version))
+
 
 class TIFeature(Flags):
     """
@@ -180,4 +214,4 @@ __all__ = ["TI_82",
            "TI_84PT", "TI_82A",
            "TI_84PCSE",
            "TI_84PCE", "TI_84PCET", "TI_83PCE", "TI_83PCEEP", "TI_84PCEPY", "TI_84PCETPE", "TI_82AEP",
-           "TIFeature", "TIModel", "OsVersion"]
+           "TIFeature", "TIModel", "OsVersion", "os_rank"]
@@ -5,6 +5,9 @@ Numeric helper functions and converters
 
 import decimal as dec
 
+from fractions import Fraction
+from functools import lru_cache
+
 from .data import *
 
 
@@ -12,6 +15,20 @@ pi = dec.Decimal("3.1415926535898")
 e = dec.Decimal("2.718281828459")
 
 
+@lru_cache(maxsize=4096)
+def limit_fraction(decimal: dec.Decimal) -> Fraction:
+    """
+    Finds the closest fraction to a decimal with denominator at most 10000, as done by exact types
+
+    Results are memoized, so repeated values are only approximated once.
+
+    :param decimal: The input decimal
+    :return: The closest fraction to ``decimal``
+    """
+
+    return Fraction(decimal).limit_denominator(10000)
+
+
 def replacer(string: str, replacements: dict[str, str]) -> str:
     """
     Iteratively applies string replacements
@@ -174,5 +191,5 @@ class RightNibbleBCD(Converter):
         return bytes(data)
 
 
-__all__ = ["pi", "e", "replacer", "sign", "squash",
+__all__ = ["pi", "e", "limit_fraction", "replacer", "sign", "squash",
            "BCD", "LeftNibbleBCD", "RightNibbleBCD"]
@@ -3,7 +3,40 @@ Token objects
 """
 
 
+from functools import cache
+
 from tivars.tokens.scripts import *
+from tivars.tokens.scripts.parse import MODEL_ORDER
+
+
+@cache
+def _rank(model: str, version: str) -> int:
+    match version:
+        case "":
+            key = 0
+
+        case "latest":
+            key = (1 << 72) - 1
+
+        case _:
+            parts = [min(int(part or 0), 0xFFFF) for part in version.split(".")[:4]]
+            key = 1 + sum(part << 16 * (3 - index) for index, part in enumerate(parts))
+
+    return MODEL_ORDER[model] << 72 | key
+
+
+def os_rank(os: OsVersion) -> int:
+    """
+    Ranks an OS version as an integer, such that comparing ranks compares the OS versions
+
+    Ranks are computed once per model and version.
+    Version numbers are compared numerically by up to their first four parts.
+
+    :param os: The OS version to rank
+    :return: The rank of ``os``
+    """
+
+    return _rank(os.model, os.version)
 
 
 class TIToken(Token):
@@ -17,6 +50,9 @@ class TIToken(Token):
     def __init__(self, token: Token):
         super().__init__(token.bits, token.langs, token.attrs, token.since, token.until)
 
+        self.since_rank = os_rank(self.since)
+        self.until_rank = os_rank(self.until)
+
         self.translation = self.langs[None] = self.langs["en"]
 
     def __repr__(self) -> str:
@@ -69,4 +105,4 @@ class IllegalToken(TIToken):
                                {"illegal": "true"}))
 
 
-__all__ = ["TIToken", "IllegalToken"]
+__all__ = ["TIToken", "IllegalToken", "os_rank"]
@@ -3,9 +3,8 @@ Tokenization utilities derived from the token sheets (see tokens directory)
 """
 
 
-from warnings import warn
-
 from tivars.data import String
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.token import *
 from tivars.tokens.scripts import *
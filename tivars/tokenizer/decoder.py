@@ -3,8 +3,7 @@ Token stream decoder
 """
 
 
-from warnings import warn
-
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.token import *
 from tivars.trie import *
@@ -27,7 +26,7 @@ def decode(bytestream: bytes, *, tokens: TITokens = None) -> tuple[list[TIToken]
     tokens = tokens or TI_84PCE.tokens
 
     out = []
-    since = OsVersions.INITIAL
+    since, rank = OsVersions.INITIAL, 0
 
     index = 0
     curr_bytes = b''
@@ -37,14 +36,15 @@ def decode(bytestream: bytes, *, tokens: TITokens = None) -> tuple[list[TIToken]
 
         if curr_bytes[0]:
             if curr_bytes in tokens.bytes:
-                out.append(tokens.bytes[curr_bytes])
-                since = max(tokens.bytes[curr_bytes].since, since)
+                out.append(token := tokens.bytes[curr_bytes])
+                if token.since_rank >= rank:
+                    since, rank = token.since, token.since_rank
 
                 curr_bytes = b''
 
             elif len(curr_bytes) >= 2:
                 warn(f"Unrecognized byte(s) '0x{curr_hex}' at position {index}.",
-                     BytesWarning)
+                     BytesWarning, code="token", offset=index)
 
                 out.append(IllegalToken(curr_bytes))
                 curr_bytes = b''
@@ -58,7 +58,7 @@ def decode(bytestream: bytes, *, tokens: TITokens = None) -> tuple[list[TIToken]
 
             warn(f"There are {count} unexpected null bytes at position {index}." if count > 1 else
                  f"There is an unexpected null byte at position {index}.",
-                 BytesWarning)
+                 BytesWarning, code="null-byte", offset=index)
 
             curr_bytes = b''
             index -= 1
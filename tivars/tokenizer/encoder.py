@@ -47,7 +47,7 @@ def encode(string: str, *,
     mode = mode or "smart"
 
     data = b''
-    since = OsVersions.INITIAL
+    since, rank = OsVersions.INITIAL, 0
     index = 0
 
     match mode:
@@ -75,7 +75,8 @@ def encode(string: str, *,
             raise ValueError(f"stack consumed at position {index}: '{string[:12]}'")
 
         data += token.bits
-        since = max(token.since, since)
+        if token.since_rank >= rank:
+            since, rank = token.since, token.since_rank
 
         index += len(string) - len(remainder)
         string = remainder
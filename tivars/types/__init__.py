@@ -47,6 +47,7 @@ else:
                "TIRealRadical", "TIComplexRadical",
                "TIComplexPi", "TIComplexPiFraction",
                "TIRealPi", "TIRealPiFraction",
+               "RealArray",
                "TIOperatingSystem", "TIApp", "TICertificate", "TILicense",
                "DeviceType"
                ]
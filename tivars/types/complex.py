@@ -3,9 +3,10 @@ Complex numeric types
 """
 
 
-from warnings import warn
+import re
 
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.numeric import *
 from tivars.var import TIEntry
@@ -110,6 +111,8 @@ class ComplexEntry(TIEntry):
 
     min_data_length = 18
 
+    literal = re.compile(r"(?:[\d_.+\-~*/()√πij\[\]]|pi|sqrt)*(?:\|?e.*)?", re.IGNORECASE)
+
     is_exact = False
     """
     Whether this numeric type is exact
@@ -3,13 +3,14 @@ GDBs and their settings
 """
 
 
+import copy
 import json
 import os
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from io import BytesIO
-from warnings import catch_warnings, filterwarnings, warn
 
+from tivars.diagnostics import warn
 from tivars.flags import *
 from tivars.data import *
 from tivars.models import *
@@ -203,6 +204,9 @@ class TIGraphedEquation(TIEquation, register=True, override=0x23):
                 :return: The bytes in ``data``, unchanged
                 """
 
+                if (batch := instance._batch) is not None and "equations" in batch:
+                    return copy.copy(batch["equations"][index])
+
                 return instance.equations[index]
 
             @classmethod
@@ -215,33 +219,33 @@ class TIGraphedEquation(TIEquation, register=True, override=0x23):
                 :return: The bytes in ``value``, unchanged
                 """
 
-                # Set appropriate equation
-                equations = list(instance.equations)
-                equations[index] = value
-
-                # Set styles
-                data = instance.raw.calc_data[:instance.offset]
-                for i in range(0, instance.num_equations, instance.num_equations // instance.num_styles):
-                    data += equations[i].raw.style
-
-                # Set data
-                data += b''.join(equation.raw.calc_data for equation in equations)
+                # Within a batch, equations are staged and only assembled once the batch ends
+                if (batch := instance._batch) is not None:
+                    if "equations" not in batch:
+                        batch["equations"] = list(instance.equations)
 
-                # Set colors (if they exist)
-                if color := instance.get_color_data():
-                    data += b'84C'
-                    for i in range(0, instance.num_equations, instance.num_equations // instance.num_styles):
-                        data += equations[i].raw.color
+                    batch["equations"][index] = copy.copy(value)
+                    return instance.raw.calc_data
 
-                    data += color[-5:]
+                equations = list(instance.equations)
+                equations[index] = value
 
-                return data
+                return instance.assemble_equations(equations)
 
         return IndexedEquationConverter
 
     def __iter__(self) -> Iterator:
         return iter(self.dict().items())
 
+    def __reduce__(self) -> tuple:
+        return self.__class__, (), (self.bytes(), self.raw.style + self.raw.color)
+
+    def __setstate__(self, state: tuple[bytes, bytes]):
+        data, bundled = state
+        super().__setstate__(data)
+
+        self.raw.style, self.raw.color = bundled[0:1], bundled[1:2]
+
     @Section(1, GraphStyle)
     def style(self) -> bytes:
         """
@@ -337,7 +341,7 @@ class TIGraphedEquation(TIEquation, register=True, override=0x23):
         :param equation: The equation to load
         """
 
-        self.raw.calc_data[1:] = equation.calc_data
+        self.raw.calc_data = self.raw.calc_data[:1] + equation.calc_data
 
     def equation(self) -> TIEquation:
         """
@@ -345,9 +349,10 @@ class TIGraphedEquation(TIEquation, register=True, override=0x23):
         """
 
         # Kinda yucky ngl
-        with catch_warnings():
-            filterwarnings("ignore", "The data section length is incorrect")
-            return TIEquation(self.bytes()[:-self.calc_data_length] + self.bytes()[-self.calc_data_length + 1:])
+        equation = TIEquation()
+        equation.load_bytes(self.bytes()[:-self.calc_data_length] + self.bytes()[-self.calc_data_length + 1:],
+                            trusted=True)
+        return equation
 
     @Loader[str]
     def load_string(self, string: str, *, model: TIModel = None, lang: str = None, mode: str = None):
@@ -581,6 +586,38 @@ class TIMonoGDB(SizedEntry, register=True):
 
         return equations
 
+    def assemble_equations(self, equations: Sequence[TIGraphedEquation]) -> bytes:
+        """
+        Assembles the data of this GDB with its equations replaced
+
+        :param equations: The equations to store, in order
+        :return: The data of this GDB with its equations, styles, and colors (if they exist) set from ``equations``
+        """
+
+        # Set styles
+        data = self.raw.calc_data[:self.offset]
+        for i in range(0, self.num_equations, self.num_equations // self.num_styles):
+            data += equations[i].raw.style
+
+        # Set data
+        data += b''.join(equation.raw.calc_data for equation in equations)
+
+        # Set colors (if they exist)
+        if color := self.get_color_data():
+            data += b'84C'
+            for i in range(0, self.num_equations, self.num_equations // self.num_styles):
+                data += equations[i].raw.color
+
+            data += color[-5:]
+
+        return data
+
+    def _end_batch(self, batch: dict):
+        if "equations" in batch:
+            self.raw.calc_data = bytearray(self.assemble_equations(batch["equations"]))
+
+        super()._end_batch(batch)
+
     def get_min_os(self, data: bytes = None) -> OsVersion:
         return max([eq.get_min_os() for eq in self.get_equations(data)], default=OsVersions.INITIAL)
 
@@ -596,59 +633,63 @@ class TIMonoGDB(SizedEntry, register=True):
         """
 
         self.clear()
-        self.raw.calc_data[3] = {
+        calc_data = self.raw.calc_data
+        calc_data[3] = {
             'Function': 0x10,
             'Parametric': 0x40,
             'Polar': 0x20,
             'Sequence': 0x80
         }.get(mode := dct.get("graphMode", "Function"), 0x00)
 
-        # Load formatSettings
-        for setting in dct.get("formatSettings", []):
-            try:
-                self.mode_flags |= getattr(GraphMode, setting)
-
-            except AttributeError:
-                warn(f"Unrecognized format setting ({setting}).",
-                     UserWarning)
-
-        # Load extSettings
-        ext_settings = dct.get("extSettings", {})
-        if "showExpr" in ext_settings:
-            self.extended_mode_flags |= GraphMode.ExprOn if ext_settings["showExpr"] else GraphMode.ExprOff
-
-        if self.raw.calc_data[3] != 0x80:
-            if "seqMode" in ext_settings or "seqSettings" in dct:
-                warn(f"Sequence settings have been provided, but this GDB is for {mode.lower()} graphs.",
-                     UserWarning)
-
-        # Load globalWindowSettings
-        for var, value in dct.get("globalWindowSettings", {}).items():
-            if not hasattr(self, var):
-                warn(f"Unrecognized window setting ({var}).",
-                     UserWarning)
-            else:
-                setattr(self, var, TIReal(value))
-
-        # Load specific data
-        data = dct.get("specificData", {})
-        for var, value in data.get("settings", {}).items():
-            if not hasattr(self, var):
-                warn(f"Unrecognized window setting ({var}).",
-                     UserWarning)
-            else:
-                setattr(self, var, TIReal(value))
-
-        # Load equations
-        for name, equation in data.get("equations", {}).items():
-            if name in self.equation_names:
-                plotted = TIGraphedEquation(name=name)
-                plotted.load_dict(equation)
-                setattr(self, name, plotted)
-
-            else:
-                warn(f"Unrecognized equation ({name}).",
-                     UserWarning)
+        self.raw.calc_data = calc_data
+
+        with self.batch():
+            # Load formatSettings
+            for setting in dct.get("formatSettings", []):
+                try:
+                    self.mode_flags |= getattr(GraphMode, setting)
+
+                except AttributeError:
+                    warn(f"Unrecognized format setting ({setting}).",
+                         UserWarning)
+
+            # Load extSettings
+            ext_settings = dct.get("extSettings", {})
+            if "showExpr" in ext_settings:
+                self.extended_mode_flags |= GraphMode.ExprOn if ext_settings["showExpr"] else GraphMode.ExprOff
+
+            if self.raw.calc_data[3] != 0x80:
+                if "seqMode" in ext_settings or "seqSettings" in dct:
+                    warn(f"Sequence settings have been provided, but this GDB is for {mode.lower()} graphs.",
+                         UserWarning)
+
+            # Load globalWindowSettings
+            for var, value in dct.get("globalWindowSettings", {}).items():
+                if not hasattr(self, var):
+                    warn(f"Unrecognized window setting ({var}).",
+                         UserWarning)
+                else:
+                    setattr(self, var, TIReal(value))
+
+            # Load specific data
+            data = dct.get("specificData", {})
+            for var, value in data.get("settings", {}).items():
+                if not hasattr(self, var):
+                    warn(f"Unrecognized window setting ({var}).",
+                         UserWarning)
+                else:
+                    setattr(self, var, TIReal(value))
+
+            # Load equations
+            for name, equation in data.get("equations", {}).items():
+                if name in self.equation_names:
+                    plotted = TIGraphedEquation(name=name)
+                    plotted.load_dict(equation)
+                    setattr(self, name, plotted)
+
+                else:
+                    warn(f"Unrecognized equation ({name}).",
+                         UserWarning)
 
         # Set type if color data exists so it can be loaded
         if "global84CSettings" in dct:
@@ -5,9 +5,9 @@ Groups
 
 from collections.abc import Sequence
 from io import BytesIO
-from warnings import warn
 
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.var import TIEntry, SizedEntry
 from .appvar import *
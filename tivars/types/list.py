@@ -3,12 +3,15 @@ Lists
 """
 
 
-from collections.abc import Iterator, Sequence
-from io import BytesIO
-from warnings import warn
+import csv
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO, TextIO
 
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
+from tivars.numeric import replacer, squash
 from tivars.tokenizer import *
 from tivars.var import TIEntry
 from .complex import *
@@ -150,14 +153,13 @@ class TIList(TIEntry):
     def supported_by(self, model: TIModel) -> bool:
         return super().supported_by(model) and (self.get_version() <= 0x0B or model.has(TIFeature.ExactMath))
 
-    @Loader[bytes, bytearray, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
-        super().load_bytes(data)
+    def validate(self):
+        super().validate()
 
         if self._E.min_data_length and self.calc_data_length // self._E.min_data_length != self.length:
             warn(f"The list has an unexpected length "
                  f"(expected {self.length}, got {self.calc_data_length // self._E.min_data_length}).",
-                 BytesWarning)
+                 BytesWarning, code="data-length")
 
     @Loader[Sequence]
     def load_list(self, lst: Sequence[_E]):
@@ -182,6 +184,89 @@ class TIList(TIEntry):
     def load_string(self, string: str):
         self.load_list([self._E(element) for element in "".join(string.strip("[]{}")).split(",")])
 
+    @classmethod
+    def encode_element(cls, element) -> bytes:
+        """
+        Encodes a single element of this list type into its data bytes
+
+        Plain numbers are encoded directly; all other formats are parsed by constructing an element entry.
+
+        :param element: The element to encode
+        :return: The data bytes of ``element``
+        """
+
+        return cls._E(element).calc_data
+
+    def load_elements(self, elements: Iterable):
+        """
+        Loads an iterable of elements into this list, encoding each element as it is read
+
+        TI-OS imposes a limit of 999 elements; any further elements are not read.
+
+        :param elements: The elements to load
+        """
+
+        data = bytearray()
+        length = 0
+
+        for element in elements:
+            if length == 999:
+                warn("The list is too long (> 999); truncating to 999 elements.",
+                     UserWarning)
+                break
+
+            data += self.encode_element(element)
+            length += 1
+
+        self.length = length
+        self.data = data
+
+    def load_csv(self, file: str | TextIO, *, delimiter: str = ","):
+        """
+        Loads this list from a CSV file, reading its cells in row-major order
+
+        :param file: A filename or text file to read from
+        :param delimiter: The CSV delimiter (defaults to ``,``)
+        """
+
+        if isinstance(file, str):
+            with open(file, newline="", encoding="utf-8") as csv_file:
+                self.load_csv(csv_file, delimiter=delimiter)
+
+        else:
+            self.load_elements(cell for row in csv.reader(file, delimiter=delimiter)
+                               for cell in row if cell.strip())
+
+    def to_csv(self, file: str | TextIO, *, delimiter: str = ","):
+        """
+        Writes this list to a CSV file with one element per row
+
+        :param file: A filename or text file to write to
+        :param delimiter: The CSV delimiter (defaults to ``,``)
+        """
+
+        if isinstance(file, str):
+            with open(file, "w", newline="", encoding="utf-8") as csv_file:
+                self.to_csv(csv_file, delimiter=delimiter)
+
+        else:
+            csv.writer(file, delimiter=delimiter).writerows([format(entry, "")] for entry in self)
+
+    def load_npy(self, file: str | BinaryIO):
+        """
+        Loads this list from a NumPy ``.npy`` file, which is flattened if not one-dimensional
+
+        Files given by name are memory-mapped, so only the leading 999 elements are ever read.
+        Requires NumPy to be installed.
+
+        :param file: A filename or binary file to read from
+        """
+
+        import numpy as np
+
+        arr = np.load(file, mmap_mode="r" if isinstance(file, str) else None, allow_pickle=False)
+        self.load_elements(arr.flat[:1000].tolist())
+
     def coerce(self):
         for type_id, entry_type in self._type_ids.items():
             if type_id == self.data[0] & 31:
@@ -218,6 +303,27 @@ class TIRealList(TIList, register=True):
 
     _type_id = 0x01
 
+    @classmethod
+    def encode_element(cls, element: RealEntry | float | int | str) -> bytes:
+        try:
+            return TIReal.encode(element)
+
+        except (TypeError, ValueError):
+            return super().encode_element(element)
+
+    def save_npy(self, file: str | BinaryIO):
+        """
+        Saves this list to a NumPy ``.npy`` file of floats
+
+        Requires NumPy to be installed.
+
+        :param file: A filename or binary file to write to
+        """
+
+        import numpy as np
+
+        np.save(file, np.array([entry.float() for entry in self], dtype=float))
+
 
 class TIComplexList(TIList, register=True):
     """
@@ -234,5 +340,37 @@ class TIComplexList(TIList, register=True):
 
     _type_id = 0x0D
 
+    @classmethod
+    def encode_element(cls, element: ComplexEntry | complex | float | int | str) -> bytes:
+        try:
+            if isinstance(element, str):
+                # Only plain real parts are encoded directly to preserve decimal digits
+                real, imag = replacer(squash(element), {"~": "-"}), 0
+
+            elif isinstance(element, int | float | complex):
+                real, imag = complex(element).real, complex(element).imag
+
+            else:
+                return super().encode_element(element)
+
+            return TIReal.encode(real, subtype_id=TIComplex.type_id) + \
+                TIReal.encode(imag, subtype_id=TIComplex.type_id)
+
+        except (TypeError, ValueError):
+            return super().encode_element(element)
+
+    def save_npy(self, file: str | BinaryIO):
+        """
+        Saves this list to a NumPy ``.npy`` file of complex numbers
+
+        Requires NumPy to be installed.
+
+        :param file: A filename or binary file to write to
+        """
+
+        import numpy as np
+
+        np.save(file, np.array([entry.complex() for entry in self], dtype=complex))
+
 
 __all__ = ["TIList", "TIRealList", "TIComplexList"]
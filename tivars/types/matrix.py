@@ -3,14 +3,17 @@ Matrices
 """
 
 
-from collections.abc import Iterator, Sequence
+import csv
+
+from collections.abc import Iterable, Iterator, Sequence
 from io import BytesIO
-from warnings import warn
+from typing import BinaryIO, TextIO
 
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.var import TIEntry
-from .real import RealEntry
+from .real import RealEntry, TIReal
 
 
 class TIMatrix(TIEntry, register=True):
@@ -136,14 +139,13 @@ class TIMatrix(TIEntry, register=True):
     def supported_by(self, model: TIModel) -> bool:
         return super().supported_by(model) and (self.get_version() <= 0x0B or model.has(TIFeature.ExactMath))
 
-    @Loader[bytes, bytearray, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
-        super().load_bytes(data)
+    def validate(self):
+        super().validate()
 
         if self.calc_data_length // RealEntry.min_data_length != self.size:
             warn(f"The matrix has an unexpected size "
                  f"(expected {self.size}, got {self.calc_data_length // RealEntry.min_data_length}).",
-                 BytesWarning)
+                 BytesWarning, code="data-length")
 
     def load_data_section(self, data: BytesIO):
         width = int.from_bytes(width_byte := data.read(1), 'little')
@@ -179,5 +181,127 @@ class TIMatrix(TIEntry, register=True):
         self.load_matrix([[RealEntry(item) for item in row.replace("[", "").replace("]", "").split(",")]
                           for row in "".join(string.split())[1:-1].replace("],[", "][").split("][")])
 
+    @staticmethod
+    def encode_element(element: RealEntry | float | int | str) -> bytes:
+        """
+        Encodes a single matrix element into its data bytes
+
+        Plain numbers are encoded directly; all other formats are parsed by constructing an element entry.
+
+        :param element: The element to encode
+        :return: The data bytes of ``element``
+        """
+
+        try:
+            return TIReal.encode(element)
+
+        except (TypeError, ValueError):
+            return RealEntry(element).calc_data
+
+    def load_rows(self, rows: Iterable[Iterable]):
+        """
+        Loads an iterable of rows into this matrix, encoding each row as it is read
+
+        TI-OS imposes a limit of 99 rows and columns and 400 total elements; any further elements are not read.
+
+        :param rows: The rows to load
+        """
+
+        data = bytearray()
+        width = height = 0
+        truncated = False
+
+        for row in rows:
+            if not (row := list(row)):
+                continue
+
+            if not height:
+                width = len(row)
+
+            elif len(row) != width:
+                raise IndexError("matrix has uneven rows")
+
+            if height == 99 or (height + 1) * min(width, 99) > 400:
+                truncated = True
+                break
+
+            truncated |= width > 99
+            data += b''.join(map(self.encode_element, row[:99]))
+            height += 1
+
+        if truncated:
+            warn(f"The matrix is too big (> 99 rows or columns, or > 400 elements); "
+                 f"truncating to {min(width, 99)}x{height}.",
+                 UserWarning)
+
+        # Clear the dimensions first so that they are each checked against the new matrix only
+        self.clear()
+        self.width = min(width, 99) if height else 0
+        self.height = height
+        self.data = data
+
+    def load_csv(self, file: str | TextIO, *, delimiter: str = ","):
+        """
+        Loads this matrix from a CSV file, with one matrix row per line
+
+        :param file: A filename or text file to read from
+        :param delimiter: The CSV delimiter (defaults to ``,``)
+        """
+
+        if isinstance(file, str):
+            with open(file, newline="", encoding="utf-8") as csv_file:
+                self.load_csv(csv_file, delimiter=delimiter)
+
+        else:
+            self.load_rows(csv.reader(file, delimiter=delimiter))
+
+    def to_csv(self, file: str | TextIO, *, delimiter: str = ","):
+        """
+        Writes this matrix to a CSV file, with one matrix row per line
+
+        :param file: A filename or text file to write to
+        :param delimiter: The CSV delimiter (defaults to ``,``)
+        """
+
+        if isinstance(file, str):
+            with open(file, "w", newline="", encoding="utf-8") as csv_file:
+                self.to_csv(csv_file, delimiter=delimiter)
+
+        else:
+            csv.writer(file, delimiter=delimiter).writerows([format(entry, "") for entry in row]
+                                                            for row in self.matrix())
+
+    def load_npy(self, file: str | BinaryIO):
+        """
+        Loads this matrix from a two-dimensional NumPy ``.npy`` file
+
+        Files given by name are memory-mapped, so only the leading rows and columns are ever read.
+        Requires NumPy to be installed.
+
+        :param file: A filename or binary file to read from
+        """
+
+        import numpy as np
+
+        arr = np.load(file, mmap_mode="r" if isinstance(file, str) else None, allow_pickle=False)
+        if arr.ndim != 2:
+            raise ValueError(f"expected a two-dimensional array, got {arr.ndim} dimension(s)")
+
+        self.load_rows(arr[:100, :100].tolist())
+
+    def save_npy(self, file: str | BinaryIO):
+        """
+        Saves this matrix to a NumPy ``.npy`` file
+
+        Requires NumPy to be installed.
+
+        :param file: A filename or binary file to write to
+        """
+
+        import numpy as np
+
+        np.save(file, np.array([[entry.float() for entry in row] for row in self.matrix()], dtype=float)
+                .reshape(self.height, self.width))
+
 
 __all__ = ["TIMatrix"]
@@ -7,9 +7,9 @@ import re
 
 
 from collections.abc import Iterator, Sequence
-from warnings import warn
 
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.tokenizer import Name
 from tivars.var import SizedEntry
@@ -6,16 +6,22 @@ Real numeric types
 import copy
 import re
 
+from collections.abc import Iterable, Iterator, Sequence
 from decimal import Decimal, localcontext
 from fractions import Fraction
-from warnings import warn
 
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.numeric import *
 from tivars.var import TIEntry
 
 
+def _decimal(value: Decimal | float | int | str) -> Decimal:
+    # Floats are converted from their shortest round-trip representation, not their exact binary value
+    return Decimal(repr(value) if isinstance(value, float) else value)
+
+
 class RealEntry(TIEntry):
     """
     Base class for real numeric types
@@ -177,7 +183,7 @@ class RealEntry(TIEntry):
         :param decimal: The float to load
         """
 
-        self.load_decimal(Decimal(decimal))
+        self.load_decimal(_decimal(decimal))
 
     def json_number(self) -> float | str:
         """
@@ -239,6 +245,8 @@ class TIReal(RealEntry, register=True):
 
     _type_id = 0x00
 
+    literal = re.compile(r"[\d_.+\-~]*(?:\|?e.*)?", re.IGNORECASE)
+
     @Section(min_data_length)
     def calc_data(self) -> bytes:
         pass
@@ -259,10 +267,49 @@ class TIReal(RealEntry, register=True):
         The mantissa is 14 digits stored in BCD format, two digits per byte.
         """
 
+    @classmethod
+    def encode(cls, value: Decimal | float | int | str, *, subtype_id: int = None) -> bytes:
+        """
+        Encodes a real number directly into the data of a `TIReal`, without constructing an entry
+
+        The mantissa is truncated to 14 digits as done by `TIReal.load_string`.
+        Floats are converted from their shortest round-trip representation, as done by `RealEntry.load_float`.
+        Only plain decimal literals are accepted; use an entry to parse other formats.
+
+        :param value: The number to encode
+        :param subtype_id: The subtype ID to encode with (defaults to this type's ID)
+        :return: The nine data bytes representing ``value``
+        """
+
+        try:
+            neg, digits, exponent = _decimal(value).as_tuple()
+
+        except ArithmeticError:
+            raise ValueError(f"could not parse '{value}' as a real number")
+
+        if not isinstance(exponent, int):
+            raise ValueError(f"{value} cannot be represented as a real number")
+
+        subtype_id = cls._type_id if subtype_id is None else subtype_id
+
+        if not any(digits):
+            return bytes([subtype_id | neg << 7, 0x80]) + bytes(7)
+
+        while not digits[0]:
+            digits = digits[1:]
+
+        exponent += len(digits) - 1
+        if not -0x80 <= exponent < 0x80:
+            raise OverflowError(f"{value} is out of range for a real number")
+
+        return bytes([subtype_id | neg << 7, exponent + 0x80]) + \
+            bytes.fromhex("".join(map(str, digits[:14])).ljust(14, "0"))
+
     @Loader[Decimal]
     def load_decimal(self, decimal: Decimal):
         self.load_string(str(decimal))
 
+    @cached
     def decimal(self) -> Decimal:
         with localcontext() as ctx:
             ctx.prec = 14
@@ -342,6 +389,8 @@ class TIRealFraction(TIReal, register=True):
 
     _type_id = 0x18
 
+    literal = re.compile(r"[\d_.e+\-/]*", re.IGNORECASE)
+
     def __format__(self, format_spec: str) -> str:
         match format_spec:
             case "" | "#":
@@ -359,7 +408,7 @@ class TIRealFraction(TIReal, register=True):
         super().load_string(str(decimal))
 
     def fraction(self) -> Fraction:
-        return Fraction(self.decimal()).limit_denominator(10000)
+        return limit_fraction(self.decimal())
 
     @Loader[str]
     def load_string(self, string: str):
@@ -392,6 +441,8 @@ class TIRealRadical(RealEntry, register=True):
 
     _type_id = 0x1C
 
+    literal = re.compile(r"(?:[\d_()*~+\-√/]|sqrt)*")
+
     def __format__(self, format_spec: str) -> str:
         def reduce(part):
             match [*part]:
@@ -515,6 +566,7 @@ class TIRealRadical(RealEntry, register=True):
     def load_decimal(self, decimal: Decimal):
         raise NotImplementedError("cannot determine exact representation from decimal approximation")
 
+    @cached
     def decimal(self) -> Decimal:
         return (self.signed_left_scalar * Decimal(self.left_radicand).sqrt() +
                 self.signed_right_scalar * Decimal(self.right_radicand).sqrt()) \
@@ -620,6 +672,8 @@ class TIRealPi(TIReal, register=True):
 
     _type_id = 0x20
 
+    literal = re.compile(r"(?:[\d_.+\-~*π]|pi)*(?:\|?e.*)?", re.IGNORECASE)
+
     def __format__(self, format_spec: str) -> str:
         match format_spec:
             case "":
@@ -636,6 +690,7 @@ class TIRealPi(TIReal, register=True):
     def load_decimal(self, decimal: Decimal):
         raise NotImplementedError("decimal loading is ambiguous for pi types")
 
+    @cached
     def decimal(self) -> Decimal:
         with localcontext() as ctx:
             ctx.prec = 14
@@ -667,6 +722,8 @@ class TIRealPiFraction(TIRealPi, TIRealFraction, register=True):
 
     _type_id = 0x21
 
+    literal = re.compile(r"[\d_.e+\-/π]*", re.IGNORECASE)
+
     def __format__(self, format_spec: str) -> str:
         match format_spec:
             case "" | "#":
@@ -676,7 +733,7 @@ class TIRealPiFraction(TIRealPi, TIRealFraction, register=True):
                 return super().__format__(format_spec)
 
     def fraction(self) -> Fraction:
-        return Fraction(self.decimal() / pi).limit_denominator(10000)
+        return limit_fraction(self.decimal() / pi)
 
     @Loader[str]
     def load_string(self, string: str):
@@ -688,5 +745,284 @@ class TIRealPiFraction(TIRealPi, TIRealFraction, register=True):
         super(TIRealPi, self).load_string(string.replace("π", ""))
 
 
+class RealArray(Sequence):
+    """
+    Contiguous array of real numbers
+
+    A `RealArray` stores the data of many real numbers in a single buffer, nine bytes per number.
+    Accessors decode the entire array at once; a `RealEntry` is only created when a single element is indexed.
+
+    The data of a `TIRealList` or `TIMatrix` (in row-major order) can be passed to an array directly.
+    """
+
+    float_types = {TIReal.type_id, TIUndefinedReal.type_id, TIRealFraction.type_id}
+    """
+    The floating-point subtypes of `RealEntry`, which are decoded directly
+    """
+
+    pi_types = {TIRealPi.type_id, TIRealPiFraction.type_id}
+    """
+    The subtypes of `RealEntry` with an implicit factor of π, which are decoded directly
+    """
+
+    fraction_types = {TIRealFraction.type_id, TIRealPiFraction.type_id}
+    """
+    The subtypes of `RealEntry` which are converted to fractions
+    """
+
+    def __init__(self, data: bytes = b''):
+        """
+        Creates an array from the concatenated data of real numbers
+
+        :param data: The data of the array (defaults to empty)
+        """
+
+        if len(data) % RealEntry.min_data_length:
+            raise ValueError(f"array data length ({len(data)}) is not a multiple of {RealEntry.min_data_length}")
+
+        self.data = bytearray(data)
+
+    def __bytes__(self) -> bytes:
+        """
+        :return: The bytes contained in this array
+        """
+
+        return self.bytes()
+
+    def __eq__(self, other: 'RealArray') -> bool:
+        """
+        Determines if two arrays contain the same bytes
+
+        :param other: The array to check against
+        :return: Whether this array is equal to ``other``
+        """
+
+        try:
+            return self.__class__ == other.__class__ and self.data == other.data
+
+        except AttributeError:
+            return False
+
+    def __getitem__(self, index: int | slice) -> 'RealEntry | RealArray':
+        """
+        :return: The element at ``index`` as a `RealEntry`, or the elements in ``index`` as a `RealArray`
+        """
+
+        length = RealEntry.min_data_length
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step == 1:
+                return self.__class__(self.data[start * length:max(stop, start) * length])
+
+            return self.__class__(b''.join(self.data[i * length:(i + 1) * length] for i in range(start, stop, step)))
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("array index out of range")
+
+        index %= len(self)
+        return RealEntry(data=self.data[index * length:(index + 1) * length])
+
+    def __iter__(self) -> Iterator[RealEntry]:
+        """
+        :return: An iterator over this array's elements as `RealEntry` values
+        """
+
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """
+        :return: The number of elements in this array
+        """
+
+        return len(self.data) // RealEntry.min_data_length
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[RealEntry]) -> 'RealArray':
+        """
+        Creates an array from the data of a sequence of real entries
+
+        :param entries: The entries to store
+        :return: An array containing ``entries``
+        """
+
+        return cls(b''.join(entry.calc_data for entry in entries))
+
+    @classmethod
+    def from_values(cls, values: Iterable[Decimal | float | int | str]) -> 'RealArray':
+        """
+        Creates an array from a sequence of numbers or number literals
+
+        :param values: The values to store
+        :return: An array containing ``values``
+        """
+
+        array = cls()
+        array.extend(values)
+        return array
+
+    @property
+    def sign_bit(self) -> list[int]:
+        """
+        :return: The sign bits of the elements of this array
+        """
+
+        return [byte >> 7 for byte in self.data[::RealEntry.min_data_length]]
+
+    @property
+    def subtype_id(self) -> list[int]:
+        """
+        :return: The subtype IDs of the elements of this array
+        """
+
+        return [byte & 63 for byte in self.data[::RealEntry.min_data_length]]
+
+    def bytes(self) -> bytes:
+        """
+        :return: The bytes contained in this array
+        """
+
+        return bytes(self.data)
+
+    def extend(self, values: Iterable[Decimal | float | int | str]):
+        """
+        Appends a sequence of numbers or number literals to this array
+
+        Plain numbers are encoded directly; all other formats are parsed by constructing an entry.
+
+        :param values: The values to append
+        """
+
+        for value in values:
+            try:
+                self.data += TIReal.encode(value)
+
+            except (TypeError, ValueError):
+                self.data += RealEntry(value).calc_data
+
+    def decimal(self) -> list[Decimal]:
+        """
+        :return: The ``decimal`` objects corresponding to the elements of this array
+        """
+
+        decimals = []
+        powers = {}
+
+        with localcontext() as ctx:
+            ctx.prec = 14
+
+            for subtype_id, sign_bit, exponent, mantissa in self._unpack():
+                if mantissa is None:
+                    decimals.append(None)
+                    continue
+
+                if exponent not in powers:
+                    powers[exponent] = Decimal(10) ** (exponent - 0x80 - 13)
+
+                decimal = Decimal(-mantissa if sign_bit else mantissa) * powers[exponent]
+                decimals.append(decimal * pi if subtype_id in self.pi_types else decimal)
+
+        # Other subtypes set their own precision
+        return [self[index].decimal() if decimal is None else decimal for index, decimal in enumerate(decimals)]
+
+    def float(self) -> list[float]:
+        """
+        :return: The ``float`` objects corresponding to the elements of this array
+        """
+
+        floats = [float(f"{'-' if sign_bit else ''}{mantissa}e{exponent - 0x80 - 13}")
+                  if mantissa is not None and subtype_id in self.float_types else None
+                  for subtype_id, sign_bit, exponent, mantissa in self._unpack()]
+
+        if None in floats:
+            decimals = self.decimal()
+            floats = [float(decimals[index]) if number is None else number for index, number in enumerate(floats)]
+
+        return floats
+
+    def fraction(self) -> list[Fraction | None]:
+        """
+        Converts the fractional elements of this array to exact fractions
+
+        Fractional multiples of π are converted to their coefficients, as done by `TIRealPiFraction.fraction`.
+
+        :return: The ``Fraction`` objects corresponding to the fractional elements of this array, or ``None`` otherwise
+        """
+
+        return [(limit_fraction(decimal / pi) if subtype_id in self.pi_types else limit_fraction(decimal))
+                if subtype_id in self.fraction_types else None
+                for subtype_id, decimal in zip(self.subtype_id, self.decimal())]
+
+    def radical(self) -> list[tuple[tuple[int, int], tuple[int, int], int] | None]:
+        """
+        Decodes the radical elements of this array
+
+        Each radical ``(± a√b ± c√d) / e`` is decoded as ``((±a, b), (±c, d), e)``.
+
+        :return: The signed (scalar, radicand) pairs and denominators of the radical elements of this array,
+                 or ``None`` otherwise
+        """
+
+        radicals = []
+        data = memoryview(self.data)
+        length = RealEntry.min_data_length
+
+        for index, offset in enumerate(range(0, len(data), length)):
+            if data[offset] & 63 != TIRealRadical.type_id:
+                radicals.append(None)
+                continue
+
+            nibbles = data[offset + 1:offset + length].hex()
+
+            try:
+                sign_type, denominator = int(nibbles[0], 16), int(nibbles[1:4])
+                right_scalar, left_scalar = int(nibbles[4:7]), int(nibbles[7:10])
+                right_radicand, left_radicand = int(nibbles[10:13]), int(nibbles[13:16])
+
+            except ValueError:
+                entry = self[index]
+                radicals.append(((entry.signed_left_scalar, entry.left_radicand),
+                                 (entry.signed_right_scalar, entry.right_radicand),
+                                 entry.denominator))
+                continue
+
+            radicals.append(((-left_scalar if sign_type & 1 else left_scalar, left_radicand),
+                             (-right_scalar if sign_type & 2 else right_scalar, right_radicand),
+                             denominator))
+
+        return radicals
+
+    def get_min_os(self) -> OsVersion:
+        """
+        Determines the minimum OS that supports every element of this array
+
+        :return: The minimum ``OsVersion`` this array supports
+        """
+
+        if any(byte in (0x18, 0x19) for byte in self.data[::RealEntry.min_data_length]):
+            return TI_84P.OS("2.53")
+
+        return OsVersions.INITIAL
+
+    def _unpack(self) -> Iterator[tuple[int, int, int, int | None]]:
+        data = memoryview(self.data)
+        length = RealEntry.min_data_length
+
+        for offset in range(0, len(data), length):
+            subtype_id = data[offset] & 63
+
+            if subtype_id in self.float_types or subtype_id in self.pi_types:
+                try:
+                    yield subtype_id, data[offset] >> 7, data[offset + 1], int(data[offset + 2:offset + length].hex())
+                    continue
+
+                except ValueError:
+                    pass
+
+            yield subtype_id, data[offset] >> 7, data[offset + 1], None
+
+
 __all__ = ["TIReal", "TIUndefinedReal", "TIRealFraction", "TIRealRadical", "TIRealPi", "TIRealPiFraction",
-           "RealEntry", "GraphRealEntry"]
+           "RealEntry", "GraphRealEntry", "RealArray"]
@@ -5,12 +5,11 @@ Graph window and table settings
 
 import json
 
-from warnings import warn
-
 from tivars.data import *
+from tivars.diagnostics import warn
 from tivars.models import *
 from tivars.var import SizedEntry
-from .real import GraphRealEntry
+from .real import GraphRealEntry, TIReal
 
 
 class SettingsEntry(SizedEntry):
@@ -38,12 +37,13 @@ class SettingsEntry(SizedEntry):
         :param dct: The dict to load
         """
 
-        for var, value in dct:
-            if not hasattr(self, var):
-                warn(f"Unrecognized window setting ({var}).",
-                     UserWarning)
-            else:
-                setattr(self, var, GraphRealEntry(value))
+        with self.batch():
+            for var, value in dct.items():
+                if not hasattr(self, var):
+                    warn(f"Unrecognized window setting ({var}).",
+                         UserWarning)
+                else:
+                    setattr(self, var, TIReal(value))
 
     @Loader[str]
     def load_string(self, string: str):
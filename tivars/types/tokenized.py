@@ -5,11 +5,10 @@ Tokenized types
 
 import re
 
-from io import BytesIO
 from typing import Iterator, Sequence
-from warnings import catch_warnings, simplefilter, warn
 
 from tivars.data import *
+from tivars.diagnostics import Diagnostics, warn
 from tivars.models import *
 from tivars.tokenizer import *
 from tivars.var import SizedEntry
@@ -42,6 +41,22 @@ class TokenizedEntry(SizedEntry):
     These tokens influence the entry's version, though detecting the presence of the RTC has no current application.
     """
 
+    version_ranks = [
+        (TI_84PCE.rank("5.3"), 0x0C),
+        (TI_84PCE.rank("5.2"), 0x0B),
+        (TI_84PCSE.rank("4.0"), 0x0A),
+        (TI_84P.rank("2.55"), 0x07),
+        (TI_84P.rank("2.53"), 0x06),
+        (TI_84P.rank("2.30"), 0x05),
+        (TI_84P.rank("2.21"), 0x04),
+        (TI_83P.rank("1.16"), 0x03),
+        (TI_83P.rank("1.15"), 0x02),
+        (TI_83P.rank("1.00"), 0x01)
+    ]
+    """
+    The minimum OS rank for each version byte, in descending order
+    """
+
     def __format__(self, format_spec: str) -> str:
         try:
             lines, sep, spec, lang = re.match(r"(?:(.*?[a-z%#])(\W+))?(\w?)(\.\w+)?$", format_spec).groups()
@@ -110,57 +125,25 @@ class TokenizedEntry(SizedEntry):
         return decode(data or self.data)[1]
 
     def get_version(self, data: bytes = None) -> int:
-        match self.get_min_os(data):
-            case os if os >= TI_84PCE.OS("5.3"):
-                version = 0x0C
-
-            case os if os >= TI_84PCE.OS("5.2"):
-                version = 0x0B
-
-            case os if os >= TI_84PCSE.OS("4.0"):
-                version = 0x0A
-
-            case os if os >= TI_84P.OS("2.55"):
-                version = 0x07
-
-            case os if os >= TI_84P.OS("2.53"):
-                version = 0x06
-
-            case os if os >= TI_84P.OS("2.30"):
-                version = 0x05
-
-            case os if os >= TI_84P.OS("2.21"):
-                version = 0x04
-
-            case os if os >= TI_83P.OS("1.16"):
-                version = 0x03
-
-            case os if os >= TI_83P.OS("1.15"):
-                version = 0x02
-
-            case os if os >= TI_83P.OS("1.00"):
-                version = 0x01
-
-            case _:
-                version = 0x00
+        rank = os_rank(self.get_min_os(data))
+        version = next((version for min_rank, version in self.version_ranks if rank >= min_rank), 0x00)
 
         if any(token in (data or self.data) for token in self.clock_tokens):
             version += 0x20
 
         return version
 
-    @Loader[bytes, bytearray, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
-        super().load_bytes(data)
+    def validate(self):
+        super().validate()
 
         try:
             if self.version != (version := self.get_version()):
                 warn(f"The version is incorrect (expected 0x{version:02x}, got 0x{self.version:02x}).",
-                     BytesWarning)
+                     BytesWarning, code="version")
 
         except ValueError as e:
             warn(f"The file contains an invalid token {' '.join(str(e).split()[2:])}.",
-                 BytesWarning)
+                 BytesWarning, code="token")
 
     @Loader[str]
     def load_string(self, string: str, *, model: TIModel = None, lang: str = None, mode: str = None):
@@ -379,19 +362,18 @@ class TIProgram(TokenizedEntry, register=True):
         self.type_id = TIProgram.type_id
         self.coerce()
 
-    @Loader[bytes, bytearray, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
-        super(TokenizedEntry, self).load_bytes(data)
+    def validate(self):
+        super(TokenizedEntry, self).validate()
 
         if self.is_tokenized:
             try:
                 if self.version != (version := self.get_version()):
                     warn(f"The version is incorrect (expected 0x{version:02x}, got 0x{self.version:02x}).",
-                         BytesWarning)
+                         BytesWarning, code="version")
 
             except ValueError as e:
                 warn(f"The file contains an invalid token {' '.join(str(e).split()[2:])}.",
-                     BytesWarning)
+                     BytesWarning, code="token")
 
     @Loader[str]
     def load_string(self, string: str, *, model: TIModel = None, lang: str = None, mode: str = None):
@@ -406,19 +388,17 @@ class TIProgram(TokenizedEntry, register=True):
             warn("ASM programs may not have tokenized data.",
                  UserWarning)
 
-            with catch_warnings():
-                simplefilter("ignore")
+            with Diagnostics("ignore"):
                 return super().string()
 
         else:
             return super().string()
 
     def coerce(self):
-        with catch_warnings():
-            simplefilter("error")
-
+        with Diagnostics("error"):
             try:
-                self.string()
+                # Decode as a plain program, since this entry may have already been coerced to an ASM program
+                super().string()
                 doors = False
 
             except BytesWarning:
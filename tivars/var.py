@@ -3,15 +3,21 @@ The fundamental var components
 """
 
 
+import copy
+import hashlib
+import mmap
+import os
 import re
 
-from collections.abc import Iterator
+from collections.abc import Iterator, MutableSequence
+from contextlib import contextmanager
 from io import BytesIO
 from sys import version_info
 from typing import BinaryIO
-from warnings import catch_warnings, simplefilter, warn
 
+from .cache import ParseCache
 from .data import *
+from .diagnostics import Diagnostics, warn
 from .models import *
 from .tokenizer import Name
 
@@ -90,8 +96,9 @@ class TIHeader:
         :return: A copy of this header
         """
 
-        new = TIHeader()
-        new.load_bytes(self.bytes())
+        new = object.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.raw = copy.copy(self.raw)
         return new
 
     def __eq__(self, other: 'TIHeader') -> bool:
@@ -116,7 +123,7 @@ class TIHeader:
         :return: A var with this header and ``other`` as its entries
         """
 
-        new = other[0].export(header=self, name=other[0].name, model=self.targets().pop())
+        new = other[0].export(header=self, name=other[0].name, model=min(self.targets()))
 
         for entry in other[1:]:
             new.add_entry(entry)
@@ -130,6 +137,16 @@ class TIHeader:
 
         return 53
 
+    def __reduce__(self) -> tuple:
+        """
+        :return: The class and bytes of this header, from which it is rebuilt when unpickled
+        """
+
+        return self.__class__, (), self.bytes()
+
+    def __setstate__(self, state: bytes):
+        self.load_bytes(state)
+
     @Section(8, String)
     def magic(self) -> str:
         """
@@ -160,7 +177,15 @@ class TIHeader:
         The comment attached to the var
         """
 
-    def targets(self) -> set[TIModel]:
+    _layout = Layout(magic, extra, product_id, comment)
+
+    # The models each file magic and product ID can target, where a product ID of None matches any model
+    _targets = {(magic, None): frozenset(m for m in TIModel.MODELS if m.magic == magic)
+                for magic in {model.magic for model in TIModel.MODELS}} | \
+               {key: frozenset(m for m in TIModel.MODELS if (m.magic, m.product_id) == key)
+                for key in {(model.magic, model.product_id) for model in TIModel.MODELS} if key[1] != 0x00}
+
+    def targets(self) -> frozenset[TIModel]:
         """
         Determines which model(s) this header can target
 
@@ -173,14 +198,14 @@ class TIHeader:
         :return: A set of models that this header can target
         """
 
-        models = {m for m in TIModel.MODELS if m.magic == self.magic}
+        magic = self.magic
 
-        if self.product_id != 0x00:
-            if filtered := {m for m in models if m.product_id == self.product_id}:
+        if (product_id := self.product_id) != 0x00:
+            if filtered := TIHeader._targets.get((magic, product_id)):
                 return filtered
 
-        if not models:
-            raise ValueError(f"file magic '{self.magic}' not recognized")
+        if (models := TIHeader._targets.get((magic, None))) is None:
+            raise ValueError(f"file magic '{magic}' not recognized")
 
         return models
 
@@ -192,28 +217,19 @@ class TIHeader:
         """
 
         if hasattr(data, "read"):
-            data = BytesIO(data.read())
+            data = data.read(len(self))
 
-        data = BytesIO(data.ljust(len(self), b'\x00'))
+        if len(data) < len(self):
+            data = bytes(data).ljust(len(self), b'\x00')
 
-        # Read magic
-        self.raw.magic = data.read(8)
-
-        # Read export bytes
-        self.raw.extra = data.read(2)
-
-        # Read product ID
-        self.raw.product_id = data.read(1)
-
-        # Read comment
-        self.raw.comment = data.read(42)
+        self._layout.unpack(self.raw, data)
 
     def bytes(self) -> bytes:
         """
         :return: The bytes contained in this header
         """
 
-        return self.raw.bytes()
+        return self._layout.pack(self.raw)
 
     def load_from_file(self, file: BinaryIO):
         """
@@ -262,6 +278,8 @@ class TIEntry(Dock, Converter):
     The file extension used for this entry per-model
     """
 
+    _model_extensions = {}
+
     versions = [0x00]
     """
     The possible versions of this entry
@@ -287,9 +305,18 @@ class TIEntry(Dock, Converter):
     Bytes that always begin this entry's data
     """
 
+    literal = None
+    """
+    Pattern matched by every string this entry can load, or ``None`` if any string may be loadable
+
+    Patterns are matched against strings with all whitespace removed.
+    """
+
     _type_id = None
     _type_ids = {}
 
+    _batch = None
+
     class Raw:
         """
         Raw bytes container for `TIEntry`
@@ -301,9 +328,44 @@ class TIEntry(Dock, Converter):
         Additional methods can also be included, but should be callable from the outer class.
 
         Most entry types do not require a new ``Raw`` class since only the entry's data changes between types.
+
+        Values derived from the data sections can be stored in ``cache``, which is reset whenever a section is written.
+        Sections should thus always be reassigned rather than mutated in place.
+        This also allows copies of a container to share its sections until either is written.
+
+        The one exception is a section named in ``owned``, whose buffer was privately copied by a `View` write.
+        Later view writes modify such a buffer in place, until the container is copied or the buffer is viewed.
         """
 
-        __slots__ = "meta_length", "type_id", "name", "version", "archived", "calc_data"
+        __slots__ = "meta_length", "type_id", "name", "version", "archived", "calc_data", "cache", "owned"
+
+        def __init__(self):
+            object.__setattr__(self, "owned", set())
+
+        def __copy__(self) -> 'TIEntry.Raw':
+            """
+            :return: A copy of this container which shares its sections and cached values
+            """
+
+            new = object.__new__(self.__class__)
+            for cls in self.__class__.__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if hasattr(self, name):
+                        object.__setattr__(new, name, getattr(self, name))
+
+            object.__setattr__(new, "cache", dict(getattr(self, "cache", {})))
+
+            # Both containers now share every section
+            object.__setattr__(new, "owned", set())
+            self.owned.clear()
+            return new
+
+        def __setattr__(self, name: str, value):
+            super().__setattr__(name, value)
+
+            if name != "cache":
+                super().__setattr__("cache", {})
+                self.owned.discard(name)
 
         @property
         def calc_data_length(self) -> bytes:
@@ -404,23 +466,32 @@ class TIEntry(Dock, Converter):
 
     def __copy__(self) -> Self:
         """
+        Copies this entry without re-parsing its bytes
+
+        The copy shares its data sections with this entry until either is written.
+
         :return: A copy of this entry
         """
 
-        new = self.__class__()
-        new.load_bytes(self.bytes())
+        new = object.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.__dict__.pop("_batch", None)
+        new.raw = copy.copy(self.raw)
         return new
 
     def __eq__(self, other: 'TIEntry') -> bool:
         """
         Determines if two entries are the same type and have the same bytes
 
+        Entries are compared by their lengths, then by their content hashes (see `TIEntry.content_hash`).
+
         :param other: The entry to check against
         :return: Whether this entry is equal to ``other``
         """
 
         try:
-            return self.__class__ == other.__class__ and self.bytes() == other.bytes()
+            return self.__class__ == other.__class__ and len(self) == len(other) and \
+                self.content_hash() == other.content_hash()
 
         except AttributeError:
             return False
@@ -461,6 +532,10 @@ class TIEntry(Dock, Converter):
         if register:
             TIEntry.register(cls, override)
 
+        # Tabulate the extension for each model up front, since finding the nearest model is costly
+        cls._model_extensions = {model: cls.extensions[nearest] for model in TIModel.MODELS
+                                 if (nearest := model.nearest(cls.extensions)) is not None}
+
     def __iter__(self) -> Iterator:
         """
         :return: If this entry is a container or collection, an iterator over its elements
@@ -468,6 +543,17 @@ class TIEntry(Dock, Converter):
 
         raise NotImplementedError
 
+    def __hash__(self) -> int:
+        """
+        Hashes this entry by its content hash
+
+        An entry's hash changes whenever its data does, so entries should not be modified while in a set or dict.
+
+        :return: The hash of this entry
+        """
+
+        return hash(self.content_hash())
+
     def __len__(self) -> int:
         """
         :return: The total length of this entry's bytes
@@ -475,6 +561,16 @@ class TIEntry(Dock, Converter):
 
         return 2 + self.meta_length + 2 + self.calc_data_length
 
+    def __reduce__(self) -> tuple:
+        """
+        :return: The class and bytes of this entry, from which it is rebuilt without validation when unpickled
+        """
+
+        return self.__class__, (), self.bytes()
+
+    def __setstate__(self, state: bytes):
+        self.load_bytes(state, trusted=True)
+
     def __str__(self) -> str:
         """
         :return: A string representation of this entry
@@ -507,7 +603,7 @@ class TIEntry(Dock, Converter):
         The length of the data section of the entry
         """
 
-        return len(self.calc_data)
+        return len(self.raw.calc_data)
 
     @Section(1, Bits[:], class_attr=True)
     def type_id(self) -> int:
@@ -554,6 +650,9 @@ class TIEntry(Dock, Converter):
 
         return value
 
+    _base_layout = Layout(meta_length, 2, type_id, name, 2)
+    _flash_layout = Layout(meta_length, 2, type_id, name, version, archived, 2)
+
     @Section()
     def calc_data(self) -> bytes:
         """
@@ -566,6 +665,20 @@ class TIEntry(Dock, Converter):
         The entry's user data
         """
 
+    def calc_data_view(self) -> memoryview:
+        """
+        :return: A read-only view of the data section of this entry, without copying it
+        """
+
+        return type(self).calc_data.view(self)
+
+    def data_view(self) -> memoryview:
+        """
+        :return: A read-only view of the user data of this entry, without copying it
+        """
+
+        return type(self).data.view(self)
+
     @classmethod
     def get(cls, data: bytes, **kwargs) -> _T:
         """
@@ -647,7 +760,8 @@ class TIEntry(Dock, Converter):
         :param override: A type ID to use for registry that differs from that of the var type
         """
 
-        cls._type_ids[var_type._type_id if override is None else override] = var_type
+        # Replace rather than mutate the registry so that concurrent lookups never see it change size
+        TIEntry._type_ids = TIEntry._type_ids | {var_type._type_id if override is None else override: var_type}
 
     def archive(self):
         """
@@ -659,13 +773,41 @@ class TIEntry(Dock, Converter):
         else:
             raise TypeError("entry does not support archiving.")
 
+    @contextmanager
+    def batch(self):
+        """
+        Context manager which batches writes to this entry
+
+        Within a batch, fields derived from the data (such as the version) are only updated once the batch ends.
+
+        Batches may be nested; only the outermost batch updates derived fields.
+        """
+
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = {}
+
+        try:
+            yield self
+
+        finally:
+            batch = self._batch
+            del self._batch
+
+            self._end_batch(batch)
+
+    def _end_batch(self, batch: dict):
+        if batch.get("version"):
+            self.version = self.get_version()
+
     def clear(self):
         """
         Clears this entry's data
         """
 
-        self.raw.calc_data = bytearray(self.leading_data_bytes)
-        self.raw.calc_data.extend(bytearray(self.min_data_length - self.calc_data_length))
+        self.raw.calc_data = bytearray(self.leading_data_bytes).ljust(self.min_data_length, b'\x00')
 
     def get_min_os(self, data: bytes = None) -> OsVersion:
         """
@@ -698,7 +840,7 @@ class TIEntry(Dock, Converter):
         :return: Whether ``model`` supports this entry
         """
 
-        return self.get_min_os() < model.OS("latest")
+        return os_rank(self.get_min_os()) < model.rank("latest")
 
     def unarchive(self):
         """
@@ -711,96 +853,108 @@ class TIEntry(Dock, Converter):
             raise TypeError("entry does not support archiving.")
 
     @Loader[bytes, bytearray, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
+    def load_bytes(self, data: bytes | BytesIO, *, trusted: bool = False):
         """
         Loads a byte string or bytestream into this entry
 
+        If ``trusted`` is set, the bytes are assumed to be well-formed: the entry is still coerced,
+        but no consistency checks are made and no warnings are issued.
+        Use `TIEntry.validate` to check a trusted entry afterward.
+
         :param data: The bytes to load
+        :param trusted: Whether to skip validation of the bytes (defaults to ``False``)
         """
 
         if hasattr(data, "read"):
             data = data.read()
 
-        data = BytesIO(data.ljust(TIEntry.flash_meta_length + 4, b'\x00'))
+        if not trusted:
+            data = data.ljust(TIEntry.flash_meta_length + 4, b'\x00')
 
-        # Read meta length
-        self.raw.meta_length = data.read(2)
+        # Read meta
+        if int.from_bytes(data[0:2], 'little') == TIEntry.base_meta_length:
+            layout = TIEntry._base_layout
+            self.raw.version = b'\x00'
+            self.raw.archived = b'\x00'
 
-        # Read data length
-        data_length = data.read(2)
+        else:
+            layout = TIEntry._flash_layout
+
+        _, data_length, *_, data_length2 = layout.unpack(self.raw, data)
+        offset = layout.size
 
-        # Read and check type ID
-        self.raw.type_id = data.read(1)
+        if trusted:
+            self.raw.calc_data = bytearray(data[offset:offset + int.from_bytes(data_length, 'little')])
+            self.coerce()
+            return
 
+        # Check type ID
         if self._type_id is not None and self.type_id != self._type_id:
             if subclass := TIEntry.get_type(self.type_id):
                 if not issubclass(subclass, self.__class__):
                     warn(f"The entry type is incorrect (expected {type(self)}, got {subclass}).",
-                         BytesWarning)
+                         BytesWarning, code="entry-type", offset=4)
 
             else:
                 warn(f"The entry type is incorrect (expected {type(self)}, got an unknown type). "
                      f"Load the var file into a TIVar instance if you don't know the entry type(s).",
-                     BytesWarning)
-
-        # Read varname
-        self.raw.name = data.read(8)
-
-        # Read flash bytes
-        match self.meta_length:
-            case TIEntry.flash_meta_length:
-                self.raw.version = data.read(1)
-                self.raw.archived = data.read(1)
+                     BytesWarning, code="entry-type", offset=4)
 
-            case TIEntry.base_meta_length:
-                self.raw.version = b'\x00'
-                self.raw.archived = b'\x00'
-
-            case _:
-                warn(f"The entry meta length has an unexpected value ({self.meta_length}); "
-                     f"attempting to read flash bytes anyway.",
-                     BytesWarning)
-
-                self.raw.version = data.read(1)
-                self.raw.archived = data.read(1)
+        # Check flash bytes
+        if self.meta_length not in (TIEntry.flash_meta_length, TIEntry.base_meta_length):
+            warn(f"The entry meta length has an unexpected value ({self.meta_length}); "
+                 f"attempting to read flash bytes anyway.",
+                 BytesWarning, code="meta-length", offset=0)
 
         if self.meta_length == TIEntry.flash_meta_length and self.raw.version + self.raw.archived == data_length:
             warn(f"The entry meta length is {self.meta_length}, but the flash data is likely missing; "
-                 f"the meta section will be corrected to be flashless.")
+                 f"the meta section will be corrected to be flashless.",
+                 UserWarning, code="meta-length", offset=0)
 
             self.meta_length = TIEntry.base_meta_length
             self.raw.version = b'\x00'
             self.raw.archived = b'\x00'
+            offset = TIEntry._base_layout.size
 
         else:
             if self.raw.archived not in b'\x00\x80':
                 warn(f"The archive flag (0x{self.raw.archived.hex()}) is set to an unexpected value.",
-                     BytesWarning)
+                     BytesWarning, code="archive-flag", offset=14)
 
             # Check length
-            data_length2 = data.read(2)
             if data_length != data_length2:
                 warn(f"The var entry data lengths are mismatched ({data_length} vs. {data_length2}); "
                      f"using {data_length} to read the data section.",
-                     BytesWarning)
+                     BytesWarning, code="data-length", offset=2)
 
         # Read data
-        self.raw.calc_data = bytearray(data.read(length := int.from_bytes(data_length, 'little')))
+        self.raw.calc_data = bytearray(data[offset:offset + (length := int.from_bytes(data_length, 'little'))])
 
-        if len(self.calc_data) != length:
-            warn(f"The data section length is incorrect (expected {length}, got {len(self.calc_data)}).",
-                 BytesWarning)
+        if len(self.raw.calc_data) != length:
+            warn(f"The data section length is incorrect (expected {length}, got {len(self.raw.calc_data)}).",
+                 BytesWarning, code="data-length")
 
+        # Validate as the type being loaded, not the type coerced to
+        entry_type = self.__class__
         self.coerce()
+        entry_type.validate(self)
+
+    def validate(self):
+        """
+        Checks this entry for consistency, issuing a warning for each problem found
+
+        Validation is run automatically when loading bytes unless the load is trusted.
+        """
 
         if self.versions != [0x00] and self.version not in self.versions:
             warn(f"The version (0x{self.version:02x}) is not recognized.",
-                 BytesWarning)
+                 BytesWarning, code="version")
 
         if self.meta_length == TIEntry.base_meta_length and self.flash_only:
             warn(f"{type(self)} vars are not compatible with flashless chips.",
-                 BytesWarning)
+                 BytesWarning, code="flash-only")
 
+    @cached
     def bytes(self) -> bytes:
         """
         The bytes contained in this entry, without any var file header or metadata.
@@ -812,6 +966,26 @@ class TIEntry(Dock, Converter):
 
         return self.raw.bytes()
 
+    @cached
+    def byte_sum(self) -> int:
+        """
+        :return: The sum of the bytes contained in this entry
+        """
+
+        return sum(self.bytes())
+
+    @cached
+    def content_hash(self) -> bytes:
+        """
+        Computes a stable hash of this entry's content
+
+        The hash covers the entry's type, name, flash bytes, and data, and is only recomputed after any of them change.
+
+        :return: The 256-bit BLAKE2b digest of this entry's bytes
+        """
+
+        return hashlib.blake2b(self.bytes(), digest_size=32).digest()
+
     def load_data_section(self, data: BytesIO):
         """
         Loads the data of this entry from a bytestream
@@ -866,14 +1040,22 @@ class TIEntry(Dock, Converter):
         Loads this entry from a string representation
 
         If there is no dedicated handler for an entry type, all subclasses of the type will be considered.
+        Subclasses whose `literal` pattern does not match the string are skipped.
 
         :param string: The string to load
         """
 
-        with catch_warnings():
-            simplefilter("ignore")
+        squashed = "".join(string.split())
 
+        with Diagnostics("ignore"):
             for entry_type in self._type_ids.values():
+                # Without a dedicated handler, this type would only recurse
+                if entry_type is self.__class__:
+                    continue
+
+                if entry_type.literal is not None and not entry_type.literal.fullmatch(squashed):
+                    continue
+
                 if issubclass(entry_type, self.__class__):
                     try:
                         # Try out each possible string format
@@ -883,7 +1065,7 @@ class TIEntry(Dock, Converter):
                     except Exception:
                         continue
 
-        raise ValueError(f"could not parse '{string}' as entry type")
+        raise ValueError(f"could not parse '{string}' as {self.__class__.__name__}")
 
     def string(self) -> str:
         """
@@ -893,11 +1075,14 @@ class TIEntry(Dock, Converter):
         return format(self, "")
 
     @classmethod
-    def open(cls, filename: str) -> Self:
+    def open(cls, filename: str, *, trusted: bool = False) -> Self:
         """
         Creates a new entry from a file given a filename
 
+        If ``trusted`` is set, the entry is assumed to be well-formed and is not validated (see `TIEntry.validate`).
+
         :param filename: A filename to open
+        :param trusted: Whether to skip validation of the entry (defaults to ``False``)
         :return: The (first) entry stored in the file
         """
 
@@ -914,7 +1099,7 @@ class TIEntry(Dock, Converter):
             file.seek(2, 1)
 
             entry = cls()
-            entry.load_bytes(file.read(cls.next_entry_length(file)))
+            entry.load_bytes(file.read(cls.next_entry_length(file)), trusted=trusted)
 
             file.seek(2, 1)
 
@@ -968,13 +1153,71 @@ class TIEntry(Dock, Converter):
 
             elif self.type_id != 0xFF:
                 warn(f"Type ID 0x{self.type_id:02x} is not recognized; no coercion will occur.",
-                     BytesWarning)
+                     BytesWarning, code="type-id")
 
             else:
                 warn("Type ID is 0xFF; no coercion will occur.",
                      UserWarning)
 
 
+class LazyEntries(MutableSequence):
+    """
+    List of var entries which are only parsed once accessed
+
+    Unparsed entries are stored as spans of a buffer, such as a memory-mapped var file.
+    The buffer must remain open until every needed entry has been accessed.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap, spans: list[tuple[int, int]], *, trusted: bool = False):
+        """
+        Creates a list of entries given a buffer and the spans of each entry within it
+
+        :param buffer: The buffer containing the entries
+        :param spans: The start and end offsets of each entry in ``buffer``
+        :param trusted: Whether to skip validation of each entry as it is parsed (defaults to ``False``)
+        """
+
+        self._buffer = buffer
+        self._entries = list(spans)
+        self._trusted = trusted
+
+    def __delitem__(self, index: int | slice):
+        del self._entries[index]
+
+    def __getitem__(self, index: int | slice) -> TIEntry | list[TIEntry]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if isinstance(entry := self._entries[index], tuple):
+            start, end = entry
+
+            entry = TIEntry()
+            entry.load_bytes(self._buffer[start:end], trusted=self._trusted)
+            self._entries[index] = entry
+
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __setitem__(self, index: int | slice, entry: TIEntry | list[TIEntry]):
+        self._entries[index] = entry
+
+    def clear(self):
+        self._entries.clear()
+
+    def insert(self, index: int, entry: TIEntry):
+        self._entries.insert(index, entry)
+
+    def is_parsed(self, index: int) -> bool:
+        """
+        :param index: The index of an entry
+        :return: Whether the entry at ``index`` has been parsed
+        """
+
+        return not isinstance(self._entries[index], tuple)
+
+
 class TIVar:
     """
     Container for var files
@@ -982,6 +1225,11 @@ class TIVar:
     A var file is composed of a header and any number of entries (though most have only one).
     """
 
+    parse_cache: ParseCache = None
+    """
+    The cache of vars parsed from bytes, if any (see `ParseCache`)
+    """
+
     def __init__(self, *, name: str = "UNNAMED", header: TIHeader = None, model: TIModel = None, data: bytes = None):
         """
         Creates an empty var with a specified name, header, and targeted model
@@ -993,6 +1241,8 @@ class TIVar:
         """
 
         self._header = header or TIHeader(model)
+        self._checksum = None
+        self._mapping = None
         self.entries = []
 
         self.name = name
@@ -1021,13 +1271,25 @@ class TIVar:
 
     def __copy__(self) -> 'TIVar':
         """
+        Copies this var and each of its entries without re-parsing any bytes
+
         :return: A copy of this var
         """
 
-        new = TIVar()
-        new.load_bytes(self.bytes())
+        new = object.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+
+        new._header = copy.copy(self._header)
+        new._mapping = None
+        new.entries = [copy.copy(entry) for entry in self.entries]
         return new
 
+    def __enter__(self) -> 'TIVar':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def __eq__(self, other: 'TIVar'):
         """
         Determines if two vars contain the same entries
@@ -1038,11 +1300,21 @@ class TIVar:
 
         try:
             eq = self.__class__ == other.__class__ and len(self.entries) == len(other.entries)
+            eq = eq and self.entry_length == other.entry_length
             return eq and all(entry == other_entry for entry, other_entry in zip(self.entries, other.entries))
 
         except AttributeError:
             return False
 
+    def __hash__(self) -> int:
+        """
+        Hashes this var by its content hash
+
+        :return: The hash of this var
+        """
+
+        return hash(self.content_hash())
+
     def __len__(self):
         """
         :return: The total length of this var's bytes
@@ -1050,6 +1322,17 @@ class TIVar:
 
         return len(self._header) + self.entry_length + 2
 
+    def __reduce__(self) -> tuple:
+        """
+        :return: The class, bytes, name, and model of this var, from which it is rebuilt when unpickled
+        """
+
+        return self.__class__, (), (self.bytes(), self.name, self._model)
+
+    def __setstate__(self, state: tuple[bytes, str, TIModel]):
+        data, self.name, self._model = state
+        self.load_bytes(data, trusted=True)
+
     @property
     def entry_length(self) -> int:
         """
@@ -1068,7 +1351,7 @@ class TIVar:
         This is equal to the lower 2 bytes of the sum of all bytes in the entries.
         """
 
-        return int.to_bytes(sum(sum(entry.bytes()) for entry in self.entries) & 0xFFFF, 2, 'little')
+        return int.to_bytes(sum(entry.byte_sum() for entry in self.entries) & 0xFFFF, 2, 'little')
 
     @property
     def extension(self) -> str:
@@ -1088,13 +1371,7 @@ class TIVar:
             if self._model is None:
                 return self.entries[0].extensions[None]
 
-            extension = ""
-            for model in reversed(TIModel.MODELS):
-                if model in self.entries[0].extensions and model <= self._model:
-                    extension = self.entries[0].extensions[self._model]
-                    break
-
-            if not extension:
+            if not (extension := self.entries[0]._model_extensions.get(self._model)):
                 warn(f"The {self._model} does not support this var type.",
                      UserWarning)
 
@@ -1165,6 +1442,17 @@ class TIVar:
 
         self.entries.clear()
 
+    def close(self):
+        """
+        Closes the file mapping of a var opened with ``lazy=True``
+
+        Entries which were never accessed can no longer be parsed once the var is closed.
+        """
+
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
     def supported_by(self, model: TIModel = None) -> bool:
         """
         Determines whether a given model can support this var
@@ -1177,21 +1465,48 @@ class TIVar:
         if model is None:
             raise ValueError("no model was passed")
 
-        return model in self._header.targets() and \
-            all(entry.get_min_os() < model.OS("latest") for entry in self.entries)
+        if model not in self._header.targets():
+            return False
 
-    def load_bytes(self, data: bytes | BytesIO):
+        latest = model.rank("latest")
+        return all(os_rank(entry.get_min_os()) < latest for entry in self.entries)
+
+    def load_bytes(self, data: bytes | BytesIO, *, trusted: bool = False):
         """
         Loads a byte string or bytestream into this var
 
+        If ``trusted`` is set, the bytes are assumed to be well-formed: entries are still coerced,
+        but no consistency checks are made and no warnings are issued.
+        Use `TIVar.validate` to check a trusted var afterward.
+
+        If a `TIVar.parse_cache` is set, a copy of the var cached for identical bytes is loaded instead.
+
         :param data: The bytes to load
+        :param trusted: Whether to skip validation of the bytes (defaults to ``False``)
         """
 
         if hasattr(data, "read"):
-            data = BytesIO(data.read())
+            data = data.read()
 
-        else:
-            data = BytesIO(data)
+        if self.parse_cache is None:
+            self._load_bytes(data, trusted=trusted)
+            return
+
+        # The model is part of the key, since the diagnostics depend on it
+        var = self.parse_cache.fetch(data, lambda: self._parse(data, trusted, self._model),
+                                     self.__class__, trusted, self._model)
+        self._header.raw = var._header.raw
+        self.entries = var.entries
+        self._checksum = var._checksum
+
+    @classmethod
+    def _parse(cls, data: bytes, trusted: bool, model: TIModel | None) -> 'TIVar':
+        var = cls(model=model)
+        var._load_bytes(data, trusted=trusted)
+        return var
+
+    def _load_bytes(self, data: bytes, *, trusted: bool = False):
+        data = BytesIO(data)
 
         # Read header
         self._header.load_bytes(data.read(53))
@@ -1203,46 +1518,148 @@ class TIVar:
             self.add_entry()
 
             length = TIEntry.next_entry_length(data)
-            self.entries[-1].load_bytes(entry_data := data.read(length))
+            self.entries[-1].load_bytes(entry_data := data.read(length), trusted=trusted)
 
-            if len(entry_data) != length:
+            if not trusted and len(entry_data) != length:
                 warn(f"The data length of entry #{len(self.entries) - 1} ({type(self.entries[-1])}) is incorrect "
                      f"(expected {length}, got {len(entry_data)}).",
-                     BytesWarning)
+                     BytesWarning, code="entry-length", offset=data.tell() - len(entry_data))
+
+            entry_length -= length
+
+        # Read checksum
+        self._checksum = data.read(2)
+
+        if not trusted:
+            if entry_length < 0:
+                warn(f"The total length of entries is incorrect (expected {self.entry_length + entry_length}, "
+                     f"got {self.entry_length}).",
+                     BytesWarning, code="entry-length")
+
+            self._check(self.checksum)
+
+    def load_buffer(self, buffer: bytes | mmap.mmap, *, trusted: bool = False):
+        """
+        Loads a buffer into this var without parsing its entries
 
+        Only the header and the boundaries of each entry are read; entries are parsed once first accessed.
+        The buffer must remain valid until every needed entry has been accessed.
+
+        If ``trusted`` is set, the buffer is assumed to be well-formed and neither it nor its entries are validated.
+        Otherwise, the checksum is still not verified, since that would read every entry; use `TIVar.validate` instead.
+
+        :param buffer: The buffer to load
+        :param trusted: Whether to skip validation of the buffer (defaults to ``False``)
+        """
+
+        stream = buffer if hasattr(buffer, "seek") else BytesIO(buffer)
+
+        # Read header
+        self._header.load_bytes(buffer[:53])
+        entry_length = int.from_bytes(buffer[53:55], 'little')
+
+        # Find entries
+        spans = []
+        offset = 55
+        while entry_length > 0 and offset < len(buffer):
+            stream.seek(offset)
+            length = TIEntry.next_entry_length(stream)
+
+            if not trusted and offset + length > len(buffer):
+                warn(f"The data length of entry #{len(spans)} is incorrect "
+                     f"(expected {length}, got {max(len(buffer) - offset, 0)}).",
+                     BytesWarning, code="entry-length", offset=offset)
+
+            spans.append((offset, min(offset + length, len(buffer))))
+            offset += length
             entry_length -= length
 
-        if entry_length < 0:
-            warn(f"The total length of entries is incorrect (expected {self.entry_length + entry_length}, "
-                 f"got {self.entry_length}).",
-                 BytesWarning)
+        self.entries = LazyEntries(buffer, spans, trusted=trusted)
 
         # Read checksum
-        checksum = data.read(2)
+        self._checksum = buffer[offset:offset + 2]
+
+        if not trusted:
+            if entry_length < 0:
+                warn(f"The total length of entries is incorrect (expected {offset - 55 + entry_length}, "
+                     f"got {offset - 55}).",
+                     BytesWarning, code="entry-length")
+
+            self._check()
+
+    def _check(self, checksum: bytes = None):
+        """
+        Checks this var's header and loaded checksum, issuing a warning for each problem found
+
+        :param checksum: The expected checksum of this var (defaults to not checking the checksum)
+        """
 
         # Check model
-        if self._model and not self._model <= min(*self._header.targets()):
+        if self._model and not self._model <= min(self._header.targets()):
             warn(f"The loaded var file is incompatible with the {self._model}.",
-                 BytesWarning)
+                 BytesWarning, code="model")
 
         # Check² sum
-        if checksum != self.checksum:
-            warn(f"The checksum is incorrect (expected {self.checksum}, got {checksum}).",
-                 BytesWarning)
+        if checksum is not None and self._checksum is not None and self._checksum != checksum:
+            warn(f"The checksum is incorrect (expected {checksum}, got {self._checksum}).",
+                 BytesWarning, code="checksum")
+
+    def validate(self):
+        """
+        Checks this var and each of its entries for consistency, issuing a warning for each problem found
+
+        The checksum is compared against the one read when this var was last loaded, if any.
+        Validation is run automatically when loading unless the load is trusted.
+        """
+
+        for entry in self.entries:
+            entry.validate()
+
+        self._check(self.checksum)
 
     def bytes(self):
         """
         :return: The bytes contained in this var
         """
 
-        dump = self._header.bytes()
-        dump += int.to_bytes(self.entry_length, 2, 'little')
+        self.write(buffer := BytesIO())
+        return buffer.getvalue()
 
+    def content_hash(self) -> bytes:
+        """
+        Computes a stable hash of this var's content
+
+        The hash covers the content hash of each entry (see `TIEntry.content_hash`), and so excludes the var's header.
+
+        :return: The 256-bit BLAKE2b digest of this var's entries
+        """
+
+        digest = hashlib.blake2b(digest_size=32)
+        for entry in self.entries:
+            digest.update(entry.content_hash())
+
+        return digest.digest()
+
+    def write(self, file: BinaryIO):
+        """
+        Writes this var to a binary file in a single pass
+
+        The checksum is accumulated as each entry is written.
+        The entry length is the sum of the lengths of the entries (see `TIVar.entry_length`),
+        which is found in advance so that the file need not be seekable.
+
+        :param file: A binary file to write to
+        """
+
+        file.write(self._header.bytes())
+        file.write(int.to_bytes(self.entry_length, 2, 'little'))
+
+        checksum = 0
         for entry in self.entries:
-            dump += entry.bytes()
+            file.write(entry.bytes())
+            checksum = (checksum + entry.byte_sum()) & 0xFFFF
 
-        dump += self.checksum
-        return dump
+        file.write(int.to_bytes(checksum, 2, 'little'))
 
     def load_var_file(self, file: BinaryIO):
         """
@@ -1254,16 +1671,40 @@ class TIVar:
         self.load_bytes(file.read())
 
     @classmethod
-    def open(cls, filename: str) -> 'TIVar':
+    def open(cls, filename: str, *, lazy: bool = False, trusted: bool = False) -> 'TIVar':
         """
         Creates a new var from a file given a filename
 
+        If ``lazy`` is set, the file is memory-mapped and each entry is only parsed once first accessed.
+        The mapping stays open until the var is closed, such as by using the var as a context manager.
+        The checksum of a lazy var is not verified when opened (see `TIVar.load_buffer`).
+
+        If ``trusted`` is set, the file is assumed to be well-formed and is not validated (see `TIVar.validate`).
+
         :param filename: A filename to open
+        :param lazy: Whether to map the file and defer parsing its entries (defaults to ``False``)
+        :param trusted: Whether to skip validation of the file (defaults to ``False``)
         :return: The var stored in the file
         """
 
+        var = cls()
+
         with open(filename, 'rb') as file:
-            return cls(data=file.read())
+            # Empty files cannot be mapped
+            if not lazy or not os.fstat(file.fileno()).st_size:
+                var.load_bytes(file.read(), trusted=trusted)
+                return var
+
+            var._mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            var.load_buffer(var._mapping, trusted=trusted)
+
+        except Exception:
+            var.close()
+            raise
+
+        return var
 
     def save(self, filename: str = None):
         """
@@ -1279,13 +1720,14 @@ class TIVar:
             filename += f".{self.extension}"
 
         if self._model:
+            latest = self._model.rank("latest")
             for index, entry in enumerate(self.entries):
-                if entry.get_min_os() > self._model.OS("latest"):
+                if os_rank(entry.get_min_os()) > latest:
                     warn(f"Entry #{index + 1} is not supported by {self._model}.",
                          UserWarning)
 
         with open(filename, 'wb+') as file:
-            file.write(self.bytes())
+            self.write(file)
 
 
 class SizedEntry(TIEntry):
@@ -1313,17 +1755,15 @@ class SizedEntry(TIEntry):
         pass
 
     def clear(self):
-        self.raw.calc_data = bytearray([0, 0, *self.leading_data_bytes])
-        self.raw.calc_data.extend(bytearray(self.min_data_length - self.calc_data_length))
-        self.length = len(self.leading_data_bytes) + len(self.data)
+        self.raw.calc_data = bytearray([0, 0, *self.leading_data_bytes]).ljust(self.min_data_length, b'\x00')
+        self.length = len(self.leading_data_bytes) + len(self.data_view())
 
-    @Loader[bytes, bytearray, BytesIO]
-    def load_bytes(self, data: bytes | BytesIO):
-        super().load_bytes(data)
+    def validate(self):
+        super().validate()
 
-        if self.length != (data_length := len(self.leading_data_bytes) + len(self.data)):
+        if self.length != (data_length := len(self.leading_data_bytes) + len(self.data_view())):
             warn(f"The entry has an unexpected data length (expected {self.length}, got {data_length}).",
-                 BytesWarning)
+                 BytesWarning, code="data-length")
 
     def load_data_section(self, data: BytesIO):
         data_length = int.from_bytes(length_bytes := data.read(2), 'little')